@@ -19,6 +19,19 @@ Your job:
 
 
 class FormAnswerAgent:
+    _AGENT = None
+
+    @classmethod
+    def _agent(cls) -> Agent:
+        if cls._AGENT is None:
+            cls._AGENT = Agent(
+                name="form_answer_agent",
+                model=settings.OPENAI_MODEL_NAME,
+                system_prompt=ASK_FORM_SYSTEM_PROMPT,
+                output_type=list,
+            )
+        return cls._AGENT
+
     @staticmethod
     def ask(labels):
         prompt = f"""
@@ -35,12 +48,7 @@ class FormAnswerAgent:
         ]
         """
 
-        agent = Agent(
-            name="form_answer_agent",
-            model=settings.OPENAI_MODEL_NAME,
-            system_prompt=ASK_FORM_SYSTEM_PROMPT,
-            output_type=list,
-        )
+        agent = FormAnswerAgent._agent()
 
         for attempt in range(1, settings.AI_MAX_RETRIES + 1):
             try:
@@ -24,6 +24,19 @@ Strict Output Rules:
 
 
 class JobRelevanceAgent:
+    _AGENT = None
+
+    @classmethod
+    def _agent(cls) -> Agent:
+        if cls._AGENT is None:
+            cls._AGENT = Agent(
+                name="job_relevance_classifier",
+                model=settings.OPENAI_MODEL_NAME,
+                system_prompt=IS_RELEVANT_SYSTEM_PROMPT,
+                output_type=str,
+            )
+        return cls._AGENT
+
     @staticmethod
     def ask(job_title: str, job_description: str) -> bool:
         prompt = f"""
@@ -36,12 +49,7 @@ class JobRelevanceAgent:
         Is this job relevant?
         """
 
-        agent = Agent(
-            name="job_relevance_classifier",
-            model=settings.OPENAI_MODEL_NAME,
-            system_prompt=IS_RELEVANT_SYSTEM_PROMPT,
-            output_type=str,
-        )
+        agent = JobRelevanceAgent._agent()
 
         for attempt in range(1, settings.AI_MAX_RETRIES + 1):
             try:
@@ -32,6 +32,19 @@ Your output MUST follow this structure:
 
 
 class NormalizerAgent:
+    _AGENT = None
+
+    @classmethod
+    def _agent(cls) -> Agent:
+        if cls._AGENT is None:
+            cls._AGENT = Agent(
+                name="normalizer",
+                model=settings.OPENAI_MODEL_NAME,
+                system_prompt=NORMALIZER_SYSTEM_PROMPT,
+                output_type=NormalizerOutputSchema,
+            )
+        return cls._AGENT
+
     @staticmethod
     def ask(job_title: str, job_description: str):
         prompt = f"""
@@ -47,12 +60,7 @@ class NormalizerAgent:
         Extract and normalize both job and candidate.
         """
 
-        agent = Agent(
-            name="normalizer",
-            model=settings.OPENAI_MODEL_NAME,
-            system_prompt=NORMALIZER_SYSTEM_PROMPT,
-            output_type=NormalizerOutputSchema,
-        )
+        agent = NormalizerAgent._agent()
 
         # Retry loop
         for attempt in range(1, settings.AI_MAX_RETRIES + 1):
@@ -1,19 +1,8 @@
 import argparse
-import random
-import time
 
-from loguru import logger
-from selenium.webdriver.common.by import By
 
-from bot.db_manager import DBManager
-from bot.driver_manager import DriverManager
-from bot.enums import JobStatusEnum
-from bot.helpers.dom_utils import click_if_exists
-from bot.helpers.page_load import get_and_wait_until_loaded
-from bot.helpers.page_state import body_has_text
-from bot.logger_manager import setup_logger
-from bot.services import AuthenticationService, JobApplicatorService
-from bot.settings import settings
+# A job is tried once more on a fresh browser session when Chrome dies under it
+_JOB_ATTEMPTS = 2
 
 
 def parse_args():
@@ -24,53 +13,130 @@ def parse_args():
     return parser.parse_args()
 
 
+def unique_jobs(jobs):
+    """Yield jobs once per LinkedIn job id; the same posting can be saved from several searches."""
+    seen = set()
+    for job in jobs:
+        if job.job_id in seen:
+            continue
+        seen.add(job.job_id)
+        yield job
+
+
 def main():
-    setup_logger()
+    # Parse first: --help and bad arguments return before selenium, the DB and the services are imported
     args = parse_args()
 
+    from loguru import logger
+    from selenium.common import WebDriverException
+    from selenium.webdriver.common.by import By
+
+    from bot.db_manager import DBManager
+    from bot.driver_manager import DriverManager
+    from bot.enums import ElementsEnum, JobStatusEnum
+    from bot.helpers.dom_utils import click_if_exists, js_click_if_present
+    from bot.helpers.page_load import get_and_wait_until_loaded
+    from bot.helpers.page_state import body_text_flags
+    from bot.helpers.rate_limit import MinIntervalPacer
+    from bot.helpers.shutdown import exit_now, exit_on_sigterm
+    from bot.logger_manager import setup_logger
+    from bot.services import AuthenticationService, JobApplicatorService
+    from bot.settings import settings
+
+    apply_button_locator = (By.CLASS_NAME, "jobs-apply-button")
+    job_details_locator = (By.CSS_SELECTOR, ElementsEnum.JOB_DETAILS.value)
+
+    setup_logger()
+    exit_on_sigterm()
     logger.info("🚀 Running SeleniumBot in mode: apply")
 
     db = DBManager()
 
-    driver = DriverManager.create_driver(profile=args.username)
-
-    AuthenticationService(driver).login(username=args.username, password=args.password)
-
-    jobs = db.job.get_not_applied() if args.without_submit else db.job.get_ready_for_apply()
+    def start_session():
+        session_driver = DriverManager.create_driver(profile=args.username)
+        AuthenticationService(session_driver).login(username=args.username, password=args.password)
+        return session_driver
 
-    for job in jobs:
+    def session_alive() -> bool:
         try:
-            get_and_wait_until_loaded(driver, job.url)
-            time.sleep(settings.DELAY_TIME + random.uniform(1, 2))
-
-            # --- WORK TYPE CHECK ----
-            if body_has_text(driver, "On-site") or body_has_text(driver, "Hybrid"):
-                db.job.update_status(job.id, JobStatusEnum.WORK_TYPE_MISMATCH)
-                logger.error(f"❌ Work type mismatch. #{job.id}")
-                continue
-
-            if body_has_text(driver, "No longer accepting applications"):
-                db.job.update_status(job.id, JobStatusEnum.EXPIRED)
-                logger.error(f"❌ Request has been expired. #{job.id}")
-                continue
-
-            # --- APPLY BUTTON ----
-            if not click_if_exists(driver, By.CLASS_NAME, "jobs-apply-button", index=1, retries=5):
-                db.job.update_status(job.id, JobStatusEnum.APPLY_BUTTON)
-                logger.error(f"❌ Couldn't find apply button. #{job.id}")
-                continue
-
-            if body_has_text(driver, "Job search safety reminder"):
-                driver.find_element(By.CSS_SELECTOR, "[data-live-test-job-apply-button]").click()
-
-            logger.info(f"🔎 Processing job #{job.id}")
-
-            applicator = JobApplicatorService(driver=driver, db=db)
-            applicator.run(job=job, submit=not args.without_submit)
-        except Exception as ex:
-            logger.error(f"❌ error: {ex}")
-
-    db.close()
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def apply_to(job) -> None:
+        # The job page renders client-side; wait for its details pane before reading the body text
+        get_and_wait_until_loaded(driver, job.url, wait_for=job_details_locator)
+        pacer.acquire()
+
+        on_site, hybrid, expired = body_text_flags(driver, ["On-site", "Hybrid", "No longer accepting applications"])
+
+        # --- WORK TYPE CHECK ----
+        if on_site or hybrid:
+            db.job.update_status(job.id, JobStatusEnum.WORK_TYPE_MISMATCH)
+            logger.error("❌ Work type mismatch. #{}", job.id)
+            return
+
+        if expired:
+            db.job.update_status(job.id, JobStatusEnum.EXPIRED)
+            logger.error("❌ Request has been expired. #{}", job.id)
+            return
+
+        # --- APPLY BUTTON ----
+        if not click_if_exists(driver, *apply_button_locator, index=1, retries=5):
+            db.job.update_status(job.id, JobStatusEnum.APPLY_BUTTON)
+            logger.error("❌ Couldn't find apply button. #{}", job.id)
+            return
+
+        js_click_if_present(driver, "[data-live-test-job-apply-button]", when_text="Job search safety reminder")
+
+        logger.info("🔎 Processing job #{}", job.id)
+
+        applicator = JobApplicatorService(driver=driver, db=db)
+        applicator.run(job=job, submit=not args.without_submit)
+
+        # run() swallows its own errors, so a session lost mid-form only shows up here
+        if not session_alive():
+            raise WebDriverException("browser session lost during the application")
+
+    # One browser session for every job; a new one is only started if Chrome loses it
+    driver = start_session()
+
+    try:
+        jobs = db.job.get_not_applied() if args.without_submit else db.job.get_ready_for_apply()
+
+        # Only sleeps for whatever part of DELAY_TIME the previous job did not already take
+        pacer = MinIntervalPacer(interval=settings.DELAY_TIME)
+        for job in unique_jobs(jobs):
+            for attempt in range(_JOB_ATTEMPTS):
+                try:
+                    apply_to(job)
+                    break
+                except WebDriverException as ex:
+                    # Chrome crashing or disconnecting often surfaces as a plain WebDriverException
+                    if session_alive():
+                        logger.error("❌ error: {}", ex)
+                        break
+                    logger.warning("♻️ Browser session lost at job #{}; starting a new one.", job.id)
+                    DriverManager.close_driver(driver)
+                    driver = None
+                    try:
+                        driver = start_session()
+                    except Exception as e:
+                        logger.error("❌ Couldn't start a new browser session: {}", e)
+                        break
+                except Exception as ex:
+                    logger.error("❌ error: {}", ex)
+                    break
+            if driver is None:
+                break
+    finally:
+        if driver is not None:
+            DriverManager.close_driver(driver)
+        db.close()
+
+    # Everything is closed; skip the interpreter's shutdown work
+    exit_now()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
+import itertools
+import queue
 import random
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from loguru import logger
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
 
 from bot.agents import JobRelevanceAgent
@@ -12,64 +16,145 @@ from bot.driver_manager import DriverManager
 from bot.enums import Country, ElementsEnum
 from bot.helpers.dom_utils import click_if_exists, get_children
 from bot.helpers.page_load import get_and_wait_until_loaded
-from bot.helpers.page_state import body_has_text, has_offsite_apply_icon
+from bot.helpers.page_state import NO_RESULTS_TEXT, job_card_state, search_page_state
 from bot.helpers.rate_limit import click_with_rate_limit_checking
-from bot.helpers.safe_ops import safe_action, safe_find_element
+from bot.helpers.safe_ops import safe_action, with_refreshed
+from bot.helpers.shutdown import exit_now, exit_on_sigterm
 from bot.helpers.url_builder import build_job_url
 from bot.logger_manager import setup_logger
 from bot.settings import settings
 
+_COUNTRY_NAMES = tuple(c.name for c in Country)
+_COUNTRY_VALUES = {c.name: c.value for c in Country}
+_COUNTRY_VALID_MSG = ", ".join(_COUNTRY_NAMES)
+
+# Workers share the jobs table; re-check and insert under one lock to avoid duplicates.
+_SAVE_LOCK = threading.Lock()
+
+Worker = Tuple[object, DBManager]
+
+_PAGE_LOAD_ATTEMPTS = 3
+
+# Locators resolved once instead of per page / per card
+SIGN_IN_MODAL_LOCATOR = (By.CSS_SELECTOR, ElementsEnum.SIGN_IN_MODAL.value)
+JOB_ITEMS_LOCATOR = (By.CLASS_NAME, ElementsEnum.JOB_ITEMS.value)
+_JOB_METADATA_ARGS = (ElementsEnum.JOB_CARD_ACTIVE.value, ElementsEnum.JOB_DESCRIPTION.value)
+
+# The results list or the no-results message, whichever the search rendered
+_RESULTS_LOADED_LOCATOR = (
+    By.XPATH,
+    f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {ElementsEnum.JOB_ITEMS.value} ')]"
+    f" | //body[contains(., '{NO_RESULTS_TEXT}')]",
+)
+
+_CARD_URNS_JS = """
+return arguments[0].map((e) => {
+  const card = e.matches('[data-entity-urn]') ? e : e.querySelector('[data-entity-urn]');
+  return card ? card.getAttribute('data-entity-urn') : '';
+});
+"""
+
+# Active card urn, title, link and the description pane; description is null until it renders
+_JOB_METADATA_JS = """
+const card = document.querySelector('.' + arguments[0]);
+if (!card) return null;
+const a = card.querySelector('a');
+const desc = document.querySelector('.' + arguments[1]);
+return [
+  card.getAttribute('data-entity-urn'),
+  a ? a.innerText.trim() : '',
+  a ? a.href : '',
+  desc ? desc.innerText : null,
+];
+"""
+
+
+def search_jobs(pool: "queue.Queue[Worker]", country_values, keywords):
+    """
+    Search job listings for all countries and keywords, spread over the (driver, db) workers in the pool.
+    ``country_values`` maps each country name to its LinkedIn geo id.
+    """
+    countries = list(country_values)
+    workers = pool.qsize()
+
+    def run(task):
+        country, keyword = task
+        driver, db = pool.get()
+        try:
+            if workers > 1:
+                time.sleep(random.uniform(1, 3))  # de-synchronize parallel workers
+            explore(driver, db, country_values[country], country, keyword)
+        finally:
+            pool.put((driver, db))
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        list(executor.map(run, itertools.product(countries, keywords)))
+    finally:
+        # On SIGTERM / Ctrl-C drop the queued searches instead of running them all before exiting
+        executor.shutdown(cancel_futures=True)
+
 
-def search_jobs(driver, db, countries, keywords):
-    """Search job listings for all countries and keywords."""
-    for country in countries:
-        country_val = _country_value(country)
-        for keyword in keywords:
-            try:
-                logger.info(f"🔍 Exploring: keyword='{keyword}', country='{country}'")
-                url = build_job_url(keyword, country_val)
-                process_page(driver, db, url, country, keyword)
-            except Exception as e:
-                logger.exception(f"💥 Failed to process {keyword=} {country=}: {e}")
-                time.sleep(random.uniform(3, 6))  # small cooldown
+def explore(driver, db, country_val, country, keyword):
+    """Search job listings for a single country and keyword."""
+    try:
+        logger.info("🔍 Exploring: keyword='{}', country='{}'", keyword, country)
+        url = build_job_url(keyword, country_val)
+        process_page(driver, db, url, country, keyword)
+    except Exception as e:
+        logger.exception("💥 Failed to process keyword={!r} country={!r}: {}", keyword, country, e)
+        time.sleep(random.uniform(3, 6))  # small cooldown
 
 
 def process_page(driver, db, url, country, keyword):
     """Processes a single job results page safely."""
-    for attempt in range(3):
+    # Load once; only a timed-out load is retried
+    for attempt in range(_PAGE_LOAD_ATTEMPTS):
         try:
-            get_and_wait_until_loaded(driver, url)
-            click_if_exists(driver, By.CSS_SELECTOR, ElementsEnum.SIGN_IN_MODAL)
-            time.sleep(2)
-        except TimeoutException:
-            logger.warning(f"⚠️ Timeout loading {url}, retrying...")
+            get_and_wait_until_loaded(driver, url, wait_for=_RESULTS_LOADED_LOCATOR, require_displayed=False)
+            break
+        except (TimeoutException, TimeoutError):
+            logger.warning("⚠️ Timeout loading {}, retrying...", url)
+
+    # Modal, empty-results text and the results list in one round-trip
+    state = search_page_state(driver)
+    if state["has_modal"]:
+        click_if_exists(driver, *SIGN_IN_MODAL_LOCATOR)
 
-    if body_has_text(driver, "Please make sure your keywords are spelled correctly"):
+    if state["has_no_results"]:
         logger.info("🔎 No results found for this search.")
         return
 
-    container = safe_find_element(driver, By.CLASS_NAME, ElementsEnum.JOB_ITEMS)
-    if not container:
+    if state["job_item_count"] is None:
         logger.warning("⚠️ No job container found.")
         return
+    if not state["job_item_count"]:
+        logger.info("ℹ️ No job items found on this page.")
+        return
 
-    job_items = get_children(driver, container)
+    # A re-rendered results list only costs re-finding the container, not reloading the page
+    job_items = with_refreshed(driver, JOB_ITEMS_LOCATOR, lambda container: get_children(driver, container))
     if not job_items:
         logger.info("ℹ️ No job items found on this page.")
         return
 
-    for job_item in job_items:
+    # Resolve which cards are already saved with one query instead of one per card
+    job_ids = [_job_id_from_urn(urn) for urn in driver.execute_script(_CARD_URNS_JS, job_items)]
+    saved = db.job.existing_job_ids([jid for jid in job_ids if jid])
+
+    for index, (job_item, job_id) in enumerate(zip(job_items, job_ids)):
+        if job_id in saved:
+            logger.info("💾 This job has already been saved: #{}", job_id)
+            continue
         safe_action(
-            lambda: process_job_item(driver, db, job_item, country, keyword),
+            lambda: process_job_item(driver, db, job_item, country, keyword, index=index),
             name="process_job_item",
         )
 
 
-def process_job_item(driver, db, job_item, country, keyword):
+def process_job_item(driver, db, job_item, country, keyword, *, index=None):
     """Safely process a single job card."""
-    click_if_exists(driver, By.CSS_SELECTOR, ElementsEnum.SIGN_IN_MODAL)
-
-    if not click_with_rate_limit_checking(driver, job_item):
+    if not _click_job_item(driver, job_item, index):
         logger.debug("⏳ Skipped job due to rate limit or click failure.")
         return
 
@@ -77,53 +162,95 @@ def process_job_item(driver, db, job_item, country, keyword):
     #     driver.navigate().back()
     #     return
 
-    if has_offsite_apply_icon(driver):
+    # Offsite icon and a sign-in modal that popped up, in one round-trip
+    card_state = job_card_state(driver)
+    if card_state["sign_in_modal"]:
+        click_if_exists(driver, *SIGN_IN_MODAL_LOCATOR)
+
+    if card_state["offsite_icon"]:
         logger.info("🔗 Skipped offsite application.")
         return
 
-    active_card = safe_find_element(driver, By.CLASS_NAME, ElementsEnum.JOB_CARD_ACTIVE)
-    if not active_card:
+    metadata = _active_job_metadata(driver)
+    if not metadata:
         return
 
-    try:
-        urn = active_card.get_attribute("data-entity-urn") or ""
-        job_id = urn.rsplit(":", 1)[-1]
-        a_tag = active_card.find_element(By.TAG_NAME, "a")
-        title = a_tag.text.strip()
-        link = a_tag.get_attribute("href")
-    except Exception as e:
-        logger.warning(f"⚠️ Failed extracting job metadata: {e}")
-        return
-
-    desc_elem = safe_find_element(driver, By.CLASS_NAME, ElementsEnum.JOB_DESCRIPTION)
-    description = desc_elem.get_attribute("innerText") if desc_elem else ""
+    urn, title, link, description = metadata
+    job_id = _job_id_from_urn(urn)
 
     if db.job.exists(job_id):
-        logger.info(f"💾 This job has already been saved: #{job_id}")
+        logger.info("💾 This job has already been saved: #{}", job_id)
         return
 
     if not JobRelevanceAgent.ask(job_title=title, job_description=description):
-        logger.error(f"❌ Job is not relevant. {title} {link}")
+        logger.error("❌ Job is not relevant. {} {}", title, link)
         return
 
-    db.job.insert(
-        job_id=job_id,
-        title=title,
-        description=description,
-        country=country,
-        keyword=keyword,
-        url=link,
-    )
+    with _SAVE_LOCK:
+        if db.job.exists(job_id):
+            logger.info("💾 This job has already been saved: #{}", job_id)
+            return
+
+        db.job.insert(
+            job_id=job_id,
+            title=title,
+            description=description,
+            country=country,
+            keyword=keyword,
+            url=link,
+        )
 
-    logger.success(f"✅ Saved job: #{job_id} '{title}' ({country}, {keyword})")
+    logger.success("✅ Saved job: #{} '{}' ({}, {})", job_id, title, country, keyword)
 
 
-def _country_value(country_name: str) -> str:
+def _click_job_item(driver, job_item, index) -> bool:
+    """Clicks the card; if the list re-rendered under it, re-resolves only this card by its position."""
     try:
-        return Country[country_name.upper()].value
-    except KeyError as e:
-        valid = ", ".join([c.name for c in Country])
-        raise ValueError(f"Unknown country '{country_name}'. Valid: {valid}") from e
+        return click_with_rate_limit_checking(driver, job_item)
+    except StaleElementReferenceException:
+        if index is None:
+            raise
+
+    def click_nth(container) -> bool:
+        children = get_children(driver, container)
+        return index < len(children) and click_with_rate_limit_checking(driver, children[index])
+
+    return bool(with_refreshed(driver, JOB_ITEMS_LOCATOR, click_nth))
+
+
+def _active_job_metadata(driver, *, retries=3, delay=1) -> Optional[Tuple[str, str, str, str]]:
+    """
+    (urn, title, link, description) of the active job card in one script call per attempt.
+    Retries while the card or its description has not rendered yet.
+    """
+    metadata = None
+    for attempt in range(retries):
+        try:
+            metadata = driver.execute_script(_JOB_METADATA_JS, *_JOB_METADATA_ARGS)
+        except Exception as e:
+            logger.warning("⚠️ Failed extracting job metadata: {}", e)
+            return None
+        if metadata and metadata[3] is not None:
+            break
+        if attempt < retries - 1:
+            time.sleep(delay)
+
+    if not metadata:
+        logger.warning("⚠️ Element not found: {}", ElementsEnum.JOB_CARD_ACTIVE)
+        return None
+    urn, title, link, description = metadata
+    return urn or "", title or "", link or "", description or ""
+
+
+def _job_id_from_urn(urn: Optional[str]) -> str:
+    return (urn or "").rsplit(":", 1)[-1]
+
+
+def _country_value(country_name: str) -> str:
+    value = _COUNTRY_VALUES.get(country_name.upper())
+    if value is None:
+        raise ValueError(f"Unknown country '{country_name}'. Valid: {_COUNTRY_VALID_MSG}")
+    return value
 
 
 def _resolve_keywords() -> List[str]:
@@ -135,7 +262,7 @@ def _resolve_keywords() -> List[str]:
 
 def _resolve_countries() -> List[str]:
     configured = _split_csv(settings.COUNTRIES)
-    return [c.upper() for c in configured] if configured else [c.name for c in Country]
+    return [c.upper() for c in configured] if configured else list(_COUNTRY_NAMES)
 
 
 def _split_csv(value: Optional[str]) -> List[str]:
@@ -144,23 +271,47 @@ def _split_csv(value: Optional[str]) -> List[str]:
     return [p.strip() for p in value.split(",") if p.strip()]
 
 
+def _create_worker(index: int, total: int) -> Worker:
+    # Chrome instances cannot share a user data dir, so parallel workers get their own.
+    user_data_dir = settings.USER_DATA_DIR if total == 1 else f"{settings.USER_DATA_DIR}-{index}"
+    driver = DriverManager.create_driver(incognito=True, user_data_dir=user_data_dir)
+    return driver, DBManager()
+
+
 def main():
     setup_logger()
+    exit_on_sigterm()
     logger.info("🚀 Running SeleniumBot in mode: search")
-    driver = DriverManager.create_driver(incognito=True)
-    db = DBManager()
 
-    countries = _resolve_countries()
+    # Validate the configuration before any browser is launched
     keywords = _resolve_keywords()
+    if not keywords:
+        return
+    try:
+        country_values = {country: _country_value(country) for country in _resolve_countries()}
+    except ValueError as e:
+        logger.error("❌ {}", e)
+        return
+    countries = list(country_values)
+
+    workers = max(1, min(settings.SEARCH_CONCURRENCY, len(countries) * len(keywords)))
+    pool: "queue.Queue[Worker]" = queue.Queue()
 
     try:
-        search_jobs(driver, db, countries, keywords)
+        for i in range(workers):
+            pool.put(_create_worker(i, workers))
+        search_jobs(pool, country_values, keywords)
         logger.info("🏁 Exploration completed successfully.")
     except Exception as e:
-        logger.exception(f"❌ Critical failure in main loop: {e}")
+        logger.exception("❌ Critical failure in main loop: {}", e)
     finally:
-        safe_action(lambda: DriverManager.close_driver(driver), name="close_driver")
-        db.close()
+        while not pool.empty():
+            driver, db = pool.get_nowait()
+            safe_action(lambda: DriverManager.close_driver(driver), name="close_driver")
+            db.close()
+
+    # Everything is closed; skip the interpreter's shutdown work
+    exit_now()
 
 
 if __name__ == "__main__":
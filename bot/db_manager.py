@@ -5,16 +5,31 @@ import re
 from contextlib import contextmanager
 from typing import Any, Dict, Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from bot.models import Base
 from bot.settings import settings
 
 engine = create_engine(settings.SQLITE_DB_PATH, echo=False, future=True)
+
+
+# WAL lets search workers read while another commits; NORMAL skips an fsync per commit (safe under WAL)
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
 Base.metadata.create_all(engine)
 
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 # ----------------------------------------------------------
 # Auto-commit proxy
@@ -70,7 +85,7 @@ class DBManager:
             for cls_name, cls_obj in inspect.getmembers(module, inspect.isclass):
                 if cls_name.endswith("Repository"):
                     name_without_suffix = cls_name.replace("Repository", "")
-                    key = re.sub(r"(?<!^)(?=[A-Z])", "_", name_without_suffix).lower()
+                    key = _CAMEL_BOUNDARY_RE.sub("_", name_without_suffix).lower()
                     instance = cls_obj()
                     self._repos[key] = RepoProxy(self, instance)
 
@@ -8,10 +8,31 @@ from selenium.webdriver.chrome.options import Options
 
 from bot.settings import settings
 
+_NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
+
+# Turn off Chrome subsystems the bot never uses (fewer processes, faster startup, less memory).
+_LEAN_CHROME_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--log-level=3",
+)
+_CONTENT_SETTINGS_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+}
+
 
 class DriverManager:
     @staticmethod
-    def create_driver(profile: Optional[str] = None, incognito: bool = False):
+    def create_driver(profile: Optional[str] = None, incognito: bool = False, user_data_dir: Optional[str] = None):
         opts = Options()
 
         # --- Headless mode (modern flag) ---
@@ -19,6 +40,13 @@ class DriverManager:
             opts.add_argument("--headless=new")
             opts.add_argument("--window-size=1920,1080")
 
+        # --- Lean browser ---
+        for arg in _LEAN_CHROME_ARGS:
+            opts.add_argument(arg)
+        if Path("/.dockerenv").exists():
+            opts.add_argument("--no-sandbox")
+        opts.add_experimental_option("prefs", _CONTENT_SETTINGS_PREFS)
+
         # --- Optional incognito ---
         if incognito:
             opts.add_argument("--incognito")
@@ -26,7 +54,9 @@ class DriverManager:
         # --- User profile directory setup ---
         normalized_profile = DriverManager._normalize_profile_name(profile)
         base_dir = Path(__file__).resolve().parent.parent / "storage/profiles"
-        profile_dir = base_dir / normalized_profile if normalized_profile else Path(settings.USER_DATA_DIR)
+        profile_dir = (
+            base_dir / normalized_profile if normalized_profile else Path(user_data_dir or settings.USER_DATA_DIR)
+        )
         profile_dir.mkdir(parents=True, exist_ok=True)
 
         # --- Create driver ---
@@ -58,5 +88,5 @@ class DriverManager:
         if not value:
             return None
         value = value.strip()
-        normalized = re.sub(r"[^A-Za-z]", "", value)
+        normalized = _NON_ALPHA_RE.sub("", value)
         return normalized or None
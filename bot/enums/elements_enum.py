@@ -31,6 +31,7 @@ class ElementsEnum(str, Enum):
     CHECKBOX_FIELDSET_COMPONENT = 'fieldset[data-test-checkbox-form-component="true"]'
     JOB_CARD_ACTIVE = "job-search-card--active"
     JOB_DESCRIPTION = "description__text"
+    JOB_DETAILS = "#job-details"
 
     def __str__(self) -> str:
         return self.value
@@ -1,7 +1,8 @@
-import random
-import time
+from typing import Dict, Optional
 
+from selenium.common import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
 
 from bot.settings import settings
 
@@ -14,25 +15,74 @@ def get_children(driver, root):
         root_el = driver.find_element(by_loc, val)
     else:
         root_el = root
-    return root_el.find_elements(By.XPATH, "./*")
+    # Native Element.children instead of an XPath "./*" evaluation
+    return driver.execute_script("return Array.from(arguments[0].children);", root_el)
+
+
+def _retry_timeout(retries: int) -> float:
+    """Each retry used to cost one DELAY_TIME sleep; keep that as the overall wait budget."""
+    return retries * settings.DELAY_TIME
+
+
+def _nth_element(by, selector, index):
+    def condition(driver):
+        elements = driver.find_elements(by, selector)
+        return elements[index] if len(elements) > index else False
+
+    return condition
 
 
 def find_elements(driver, by, selector, index=0, retries=0):
-    for attempt in range(retries + 1):
-        try:
-            return driver.find_elements(by, selector)[index]
-        except Exception:
-            time.sleep(settings.DELAY_TIME + random.uniform(1, 2))
-    raise Exception(f"Could not find element {selector} in {retries} attempts")
+    try:
+        return WebDriverWait(driver, _retry_timeout(retries)).until(_nth_element(by, selector, index))
+    except TimeoutException:
+        raise Exception(f"Could not find element {selector} in {retries} attempts")
 
 
 def click_if_exists(driver, by, selector, index=0, retries=0) -> bool:
-    for attempt in range(retries + 1):
+    find = _nth_element(by, selector, index)
+
+    def click(d):
+        el = find(d)
+        if not el:
+            return False
         try:
-            driver.find_elements(by, selector)[index].click()
+            el.click()
             return True
-        except Exception:
-            time.sleep(settings.DELAY_TIME + random.uniform(1, 2))
-            if attempt == retries:
-                return False
-    return False
+        except WebDriverException:
+            return False
+
+    try:
+        return WebDriverWait(driver, _retry_timeout(retries)).until(click)
+    except TimeoutException:
+        return False
+
+
+CLICK_IF_PRESENT_JS = """
+const [selector, text] = arguments;
+if (text && !document.body.innerText.includes(text)) return false;
+const el = document.querySelector(selector);
+if (!el) return false;
+el.click();
+return true;
+"""
+
+
+def js_click_if_present(driver, selector: str, *, when_text: Optional[str] = None) -> bool:
+    """
+    Check for and click the first element matching a CSS selector in a single round-trip.
+    With ``when_text``, only click when the page body contains that text.
+    """
+    return bool(driver.execute_script(CLICK_IF_PRESENT_JS, str(selector), when_text))
+
+
+PRESENT_FLAGS_JS = """
+const out = {};
+for (const [name, selector] of Object.entries(arguments[0])) out[name] = !!document.querySelector(selector);
+return out;
+"""
+
+
+def present_flags(driver, selectors: Dict[str, str]) -> Dict[str, bool]:
+    """Presence of several CSS selectors at once: ``{name: selector}`` -> ``{name: bool}`` in one round-trip."""
+    return driver.execute_script(PRESENT_FLAGS_JS, {name: str(sel) for name, sel in selectors.items()})
@@ -0,0 +1,40 @@
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Stored embeddings: 4-byte tag + float32 scale + int8 components; untagged blobs are legacy float32.
+Q8_TAG = b"Q8\x00\x00"
+Q8_HEADER = 8
+
+
+def quantize(vector: Iterable[float]) -> bytes:
+    """
+    int8 storage blob of an embedding (scale = max(|x|) / 127), about 4x smaller than float32 bytes.
+    Returns b"" for an empty vector.
+    """
+    vec = np.nan_to_num(np.asarray(vector, dtype=np.float32), nan=0.0, posinf=0.0, neginf=0.0)
+    if vec.size == 0:
+        return b""
+    peak = float(np.abs(vec).max())
+    scale = np.float32(peak / 127.0 if peak > 0 else 1.0)
+    q = np.rint(vec / scale).astype(np.int8)
+    return Q8_TAG + scale.tobytes() + q.tobytes()
+
+
+def blob_dim(blob: Optional[bytes]) -> int:
+    """Number of components in a stored blob (int8-quantized or legacy float32), from its length."""
+    if not blob:
+        return 0
+    if blob[:4] == Q8_TAG:
+        return len(blob) - Q8_HEADER
+    return len(blob) // 4
+
+
+def decode(blob: bytes) -> np.ndarray:
+    """
+    float32 vector from a stored blob, either int8-quantized or legacy float32.
+    """
+    if blob[:4] == Q8_TAG:
+        scale = np.frombuffer(blob, dtype=np.float32, count=1, offset=4)[0]
+        return np.frombuffer(blob, dtype=np.int8, offset=Q8_HEADER).astype(np.float32) * scale
+    return np.frombuffer(blob, dtype=np.float32)
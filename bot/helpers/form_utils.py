@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, List, Set, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from selenium.common import (
     ElementClickInterceptedException,
+    ElementNotInteractableException,
     TimeoutException,
 )
 from selenium.webdriver.common.by import By
@@ -17,24 +19,39 @@ from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.wait import WebDriverWait
 
 from bot.enums import ElementsEnum
+from bot.helpers.dom_utils import js_click_if_present
 
 # ==========================================
 # Label / text cleaning
 # ==========================================
 
 
+_REQUIRED_RE = re.compile(r"\bRequired\b", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_REPEATED_PHRASE_RE = re.compile(r"(?i)(?<!\S)(.+?)(?:\s+\1)+(?!\S)")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.?!])\s+|\n+")
+
+
 def clean_label_text(text: str) -> str:
     """Normalize whitespace and remove redundant or 'Required' text."""
-    text = re.sub(r"\bRequired\b", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _REQUIRED_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text.strip())
+
+    # Both dedup passes need a space between repeats; single-word labels are done
+    if " " not in text:
+        return text
 
     # Deduplicate immediate phrase repetition
-    text = re.sub(r"(?i)(?<!\S)(.+?)(?:\s+\1)+(?!\S)", r"\1", text)
+    text = _REPEATED_PHRASE_RE.sub(r"\1", text)
+
+    # Only sentence punctuation can split the (already newline-free) text into several parts
+    if not any(c in text for c in ".?!"):
+        return text
 
     # Deduplicate repeated sentences or fragments
     seen: Set[str] = set()
     unique_parts: List[str] = []
-    for part in re.split(r"(?<=[.?!])\s+|\n+", text):
+    for part in _SENTENCE_SPLIT_RE.split(text):
         cleaned = part.strip()
         key = cleaned.lower()
         if cleaned and key not in seen:
@@ -44,14 +61,103 @@ def clean_label_text(text: str) -> str:
     return " ".join(unique_parts)
 
 
-def get_label(form: WebElement, field_id: str) -> str:
-    """Get label text by field ID and clean it."""
-    try:
-        sel = ElementsEnum.LABEL_FOR_TEMPLATE.format(id=field_id)
-        text = form.find_element(By.CSS_SELECTOR, sel).text
-    except Exception:
-        text = ""
-    return clean_label_text(text)
+# ==========================================
+# Form snapshot
+# ==========================================
+
+SNAPSHOT_FORM_JS = """
+const root = arguments[0];
+const sel = arguments[1];
+const out = {input: [], select: [], textarea: [], 'checkbox-group': [], 'radio-group': []};
+const form = root.matches(sel.form) ? root : root.querySelector(sel.form);
+if (!form) return out;
+// Native checkVisibility() (Chrome 105+) avoids a getComputedStyle per element; older builds use the box test
+const visible = (e) =>
+  e.checkVisibility
+    ? e.checkVisibility({visibilityProperty: true})
+    : !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length) && getComputedStyle(e).visibility !== 'hidden';
+const enabled = (e) => !e.disabled;
+// One pass over the form's labels instead of a selector query per field
+const labels = new Map();
+form.querySelectorAll('label[for]').forEach((l) => {
+  const id = l.getAttribute('for');
+  if (!labels.has(id)) labels.set(id, l.innerText);
+});
+const labelFor = (id) => (id && labels.get(id)) || '';
+const legendOf = (fs) => {
+  const legend = fs.querySelector('legend');
+  let text = legend ? legend.innerText : '';
+  if (!text.trim()) {
+    text = [...fs.querySelectorAll('span')].map((s) => s.innerText).filter((t) => t.trim()).join(' ');
+  }
+  return text;
+};
+const optionLabels = (fs, inputs) =>
+  inputs
+    .filter((i) => visible(i) && enabled(i))
+    .map((i) => labelFor(i.id).trim())
+    .filter(Boolean);
+const field = (kind, el, extra) => ({
+  kind: kind,
+  id: el.id,
+  label: labelFor(el.id),
+  visible: visible(el),
+  enabled: enabled(el),
+  value: el.value || '',
+  options: [],
+  ...extra,
+});
+const group = (kind, fs, inputs) => ({
+  kind: kind,
+  id: fs.id,
+  label: legendOf(fs),
+  visible: visible(fs),
+  enabled: true,
+  value: '',
+  options: optionLabels(fs, inputs),
+});
+
+form.querySelectorAll(sel.input).forEach((el) => out.input.push(field('input', el)));
+form.querySelectorAll(sel.select).forEach((el) =>
+  out.select.push(field('select', el, {options: [...el.options].map((o) => o.innerText.trim()).filter(Boolean)}))
+);
+form.querySelectorAll(sel.textarea).forEach((el) =>
+  out.textarea.push(field('textarea', el, {ariaLabel: el.getAttribute('aria-label') || ''}))
+);
+form.querySelectorAll(sel.checkboxFieldset).forEach((fs) => {
+  const boxes = [...fs.querySelectorAll(sel.checkbox)];
+  if (boxes.length) out['checkbox-group'].push(group('checkbox-group', fs, boxes));
+});
+form.querySelectorAll(sel.fieldset).forEach((fs) => {
+  const radios = [...fs.querySelectorAll(sel.radio)];
+  if (radios.length) out['radio-group'].push(group('radio-group', fs, radios));
+});
+return out;
+"""
+
+SNAPSHOT_SELECTORS: Dict[str, str] = {
+    "form": ElementsEnum.FORM.value,
+    "input": ElementsEnum.INPUT_NOT_RADIO.value,
+    "select": ElementsEnum.SELECT.value,
+    "textarea": ElementsEnum.TEXTAREA.value,
+    "checkboxFieldset": ElementsEnum.CHECKBOX_FIELDSET_COMPONENT.value,
+    "fieldset": ElementsEnum.FIELDSET.value,
+    "checkbox": ElementsEnum.INPUT_CHECKBOX.value,
+    "radio": ElementsEnum.INPUT_RADIO.value,
+}
+
+
+FormSnapshot = Dict[str, List[Dict[str, Any]]]
+
+
+def snapshot_form(driver, root: WebElement) -> FormSnapshot:
+    """
+    Walk the whole form in one execute_script call; ``root`` is the form or any container of it.
+
+    Returns raw records grouped by kind (input, select, textarea, checkbox-group, radio-group),
+    each ``{kind, id, label, visible, enabled, value, options}`` (textareas also carry ``ariaLabel``).
+    """
+    return driver.execute_script(SNAPSHOT_FORM_JS, root, SNAPSHOT_SELECTORS) or {}
 
 
 # ==========================================
@@ -59,14 +165,14 @@ def get_label(form: WebElement, field_id: str) -> str:
 # ==========================================
 
 
-def should_include_input(el: WebElement) -> bool:
-    return el.is_displayed() and el.is_enabled() and not el.get_attribute("value")
+def should_include_input(rec: Dict[str, Any]) -> bool:
+    return rec["visible"] and rec["enabled"] and not rec["value"]
 
 
-def should_include_select(el: WebElement) -> bool:
-    if not el.is_displayed() or not el.is_enabled():
+def should_include_select(rec: Dict[str, Any]) -> bool:
+    if not rec["visible"] or not rec["enabled"]:
         return False
-    value = (el.get_attribute("value") or "").strip()
+    value = (rec["value"] or "").strip()
     return not value or value == "Select an option"
 
 
@@ -75,172 +181,133 @@ def should_include_select(el: WebElement) -> bool:
 # ==========================================
 
 
+def _with_options(label: str, options: List[str]) -> str:
+    return f"{label} ({', '.join(options)})" if options else label
+
+
 def extract_fields(
-    form: WebElement,
-    selector: str,
+    snapshot: FormSnapshot,
+    kind: str,
     include_fn,
     *,
     include_options: bool = False,
 ) -> List[Dict[str, str]]:
     """Generic field extractor for inputs and selects."""
     results: List[Dict[str, str]] = []
-    for el in form.find_elements(By.CSS_SELECTOR, selector):
-        if not include_fn(el):
+    for rec in snapshot.get(kind, ()):
+        if not include_fn(rec):
             continue
 
-        field_id = el.get_attribute("id")
-        label = get_label(form, field_id)
-
+        label = clean_label_text(rec["label"])
         if include_options:
-            options = [
-                opt.text.strip() for opt in el.find_elements(By.TAG_NAME, ElementsEnum.OPTION) if opt.text.strip()
-            ]
-            if options:
-                label = f"{label} ({', '.join(options)})"
+            label = _with_options(label, rec["options"])
 
-        results.append({"id": field_id, "label": label})
+        results.append({"id": rec["id"], "label": label})
     return results
 
 
-def extract_textareas(form: WebElement) -> List[Dict[str, str]]:
+def extract_textareas(snapshot: FormSnapshot) -> List[Dict[str, str]]:
     """Extracts visible and enabled multiline text fields."""
     results: List[Dict[str, str]] = []
-    for el in form.find_elements(By.CSS_SELECTOR, ElementsEnum.TEXTAREA):
-        if not (el.is_displayed() and el.is_enabled()):
+    for rec in snapshot.get("textarea", ()):
+        if not (rec["visible"] and rec["enabled"]):
             continue
-        if el.get_attribute("value"):
+        if rec["value"]:
             continue
 
-        field_id = el.get_attribute("id")
-        label = get_label(form, field_id)
-        if not label:
-            label = el.get_attribute("aria-label") or ""
-        label = clean_label_text(label)
-        results.append({"id": field_id, "label": label})
+        label = clean_label_text(rec["label"]) or rec.get("ariaLabel", "")
+        results.append({"id": rec["id"], "label": clean_label_text(label)})
     return results
 
 
-def extract_legend_text(fieldset: WebElement) -> str:
-    """Extract and clean text from <legend> or its inner span(s)."""
-    try:
-        legend = fieldset.find_element(By.TAG_NAME, ElementsEnum.LEGEND).text
-        if not legend.strip():
-            # LinkedIn sometimes hides text in <span> elements
-            legend = " ".join(
-                span.text for span in fieldset.find_elements(By.TAG_NAME, ElementsEnum.SPAN) if span.text.strip()
-            )
-    except Exception:
-        legend = ""
-    return clean_label_text(legend)
-
-
-def extract_checkbox_groups(form: WebElement) -> List[Dict[str, str]]:
+def extract_checkbox_groups(snapshot: FormSnapshot) -> List[Dict[str, str]]:
     """Extracts multiple-choice checkbox groups (e.g., LinkedIn Easy Apply multi-select questions)."""
-    results: List[Dict[str, str]] = []
+    return [
+        {"id": rec["id"], "label": _with_options(clean_label_text(rec["label"]), rec["options"])}
+        for rec in snapshot.get("checkbox-group", ())
+        if rec["visible"]
+    ]
 
-    for fs in form.find_elements(By.CSS_SELECTOR, ElementsEnum.CHECKBOX_FIELDSET_COMPONENT):
-        if not fs.is_displayed():
-            continue
 
-        checkboxes = fs.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_CHECKBOX)
-        if not checkboxes:
-            continue
+def extract_radio_groups(snapshot: FormSnapshot) -> List[Dict[str, str]]:
+    """Extract radio button fieldsets and their labels/options."""
+    return [
+        {"id": rec["id"], "label": _with_options(clean_label_text(rec["label"]), rec["options"])}
+        for rec in snapshot.get("radio-group", ())
+        if rec["visible"]
+    ]
 
-        # Extract main question label (legend text)
-        label = extract_legend_text(fs)
 
-        # Extract option labels
-        options: List[str] = []
-        for cb in checkboxes:
-            if not (cb.is_displayed() and cb.is_enabled()):
-                continue
-            try:
-                sel = ElementsEnum.LABEL_FOR_TEMPLATE.format(id=cb.get_attribute("id"))
-                label_el = fs.find_element(By.CSS_SELECTOR, sel)
-                if label_el.text.strip():
-                    options.append(label_el.text.strip())
-            except Exception:
-                continue
+# ==========================================
+# Utilities
+# ==========================================
 
-        if options:
-            label = f"{label} ({', '.join(options)})"
 
-        results.append(
-            {
-                "id": fs.get_attribute("id"),
-                "label": label,
-            }
-        )
-    return results
+def wait_present_by_id(wait: WebDriverWait, element_id: str) -> WebElement:
+    return wait.until(ec.presence_of_element_located((By.ID, element_id)))
 
 
-def extract_radio_options(fieldset: WebElement, radios: Iterable[WebElement]) -> List[str]:
-    """Extract radio option labels."""
-    options: List[str] = []
-    for radio in radios:
-        if not (radio.is_displayed() and radio.is_enabled()):
-            continue
-        try:
-            sel = ElementsEnum.LABEL_FOR_TEMPLATE.format(id=radio.get_attribute("id"))
-            label_el = fieldset.find_element(By.CSS_SELECTOR, sel)
-            if label_el.text.strip():
-                options.append(label_el.text.strip())
-        except Exception:
-            continue
-    return options
+def scroll_into_view(driver, el: WebElement) -> None:
+    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
 
 
-def extract_radio_groups(form: WebElement) -> List[Dict[str, str]]:
-    """Extract radio button fieldsets and their labels/options."""
-    results: List[Dict[str, str]] = []
-    for fs in form.find_elements(By.CSS_SELECTOR, ElementsEnum.FIELDSET):
-        if not fs.is_displayed():
-            continue
+def scroll_all_into_view(driver, elements: List[WebElement]) -> None:
+    """Scroll every element into view in one round-trip (the handlers then skip their own scrolls)."""
+    if elements:
+        driver.execute_script("arguments[0].forEach((e) => e && e.scrollIntoView({block:'center'}));", elements)
 
-        radios = fs.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_RADIO)
-        if not radios:
-            continue
 
-        label = extract_legend_text(fs)
-        options = extract_radio_options(fs, radios)
+def _click_or_scroll_and_click(driver, el: WebElement) -> None:
+    """Click without scrolling first; scroll only when something is covering the element."""
+    try:
+        el.click()
+    except ElementClickInterceptedException:
+        scroll_into_view(driver, el)
+        el.click()
 
-        if options:
-            label = f"{label} ({', '.join(options)})"
 
-        results.append(
-            {
-                "id": fs.get_attribute("id"),
-                "label": label,
-            }
-        )
-    return results
+SET_NATIVE_VALUE_FN = """
+const setNativeValue = (el, value) => {
+  // Framework-bound fields (React) only notice values written through the prototype setter
+  const desc = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+  if (desc && desc.set) desc.set.call(el, value);
+  else el.value = value;
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+};
+"""
 
+SET_VALUE_JS = SET_NATIVE_VALUE_FN + "setNativeValue(arguments[0], arguments[1]);"
 
-# ==========================================
-# Utilities
-# ==========================================
 
+def js_set_value(driver, el: WebElement, value: str) -> None:
+    """Set a field's value and fire input/change events in a single round-trip."""
+    driver.execute_script(SET_VALUE_JS, el, value)
 
-def wait_present_by_id(wait: WebDriverWait, element_id: str) -> WebElement:
-    return wait.until(ec.presence_of_element_located((By.ID, element_id)))
 
+def needs_keystrokes(el: WebElement) -> bool:
+    """Autocomplete widgets only react to real key events, so they must be typed into."""
+    return el.get_attribute("role") == ElementsEnum.ROLE_COMBOBOX or bool(el.get_attribute("aria-autocomplete"))
 
-def scroll_into_view(driver, el: WebElement) -> None:
-    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
+
+_TRUTHY = frozenset({"true", "yes", "1", "on"})
 
 
 def is_truthy(value: Any) -> bool:
-    truthy: Set[str] = {"true", "yes", "1", "on"}
-    return str(value).strip().lower() in truthy
+    return str(value).strip().lower() in _TRUTHY
+
+
+@lru_cache(maxsize=128)
+def _split_multi(text: str) -> FrozenSet[str]:
+    # allow comma or semicolon separated strings
+    chunks = [x.strip() for x in text.replace(";", ",").split(",")]
+    return frozenset(c.lower() for c in chunks if c)
 
 
 def normalize_multi_answer(answer: Any) -> Set[str]:
     if isinstance(answer, (list, tuple, set)):
         return {str(a).strip().lower() for a in answer if str(a).strip()}
-    # allow comma or semicolon separated strings
-    text = str(answer)
-    chunks = [x.strip() for x in text.replace(";", ",").split(",")]
-    return {c.lower() for c in chunks if c}
+    return set(_split_multi(str(answer)))
 
 
 def infer_type(el: WebElement) -> str:
@@ -261,25 +328,42 @@ def infer_type(el: WebElement) -> str:
 # ==========================================
 
 
+def _fast_click(driver, wait: WebDriverWait, el: WebElement) -> None:
+    """Click right away; only poll for clickability when the element is not interactable yet."""
+    try:
+        el.click()
+    except ElementClickInterceptedException:
+        driver.execute_script("arguments[0].click();", el)
+    except ElementNotInteractableException:
+        try:
+            wait.until(ec.element_to_be_clickable(el)).click()
+        except (ElementClickInterceptedException, TimeoutException):
+            driver.execute_script("arguments[0].click();", el)
+
+
+FIELDSET_LABELS_JS = """
+// HTMLInputElement.labels resolves for= and wrapping labels natively, no selector query per option
+return [...arguments[0].querySelectorAll('input')]
+  .filter((i) => i.id && i.labels && i.labels.length)
+  .map((i) => [i.id, (i.labels[0].innerText || '').trim().toLowerCase(), i.labels[0]]);
+"""
+
+
+def _fieldset_label_map(driver, fieldset: WebElement) -> Dict[str, Tuple[WebElement, str]]:
+    """``{input_id: (label element, lowercased text)}`` for every labelled input of the fieldset, in one call."""
+    return {rid: (label, text) for rid, text, label in driver.execute_script(FIELDSET_LABELS_JS, fieldset) or []}
+
+
 def _click_radio_via_label(
     driver,
     wait: WebDriverWait,
-    fieldset: WebElement,
+    labels: Dict[str, Tuple[WebElement, str]],
     radio: WebElement,
 ) -> bool:
     rid = radio.get_attribute("id")
-    if not rid:
-        return False
-    try:
-        label = fieldset.find_element(By.CSS_SELECTOR, f"label[for='{rid}']")
-    except Exception:
+    if not rid or rid not in labels:
         return False
-
-    scroll_into_view(driver, label)
-    try:
-        wait.until(ec.element_to_be_clickable(label)).click()
-    except (ElementClickInterceptedException, TimeoutException):
-        driver.execute_script("arguments[0].click();", label)
+    _fast_click(driver, wait, labels[rid][0])
     return True
 
 
@@ -288,11 +372,14 @@ def click_radio_in_fieldset(
     wait: WebDriverWait,
     fieldset: WebElement,
     answer: str,
+    radios: Optional[List[WebElement]] = None,
 ) -> bool:
     if not answer:
         return False
 
-    radios = fieldset.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_RADIO)
+    if radios is None:
+        radios = fieldset.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_RADIO)
+    labels = _fieldset_label_map(driver, fieldset)
     answer_norm = answer.strip().lower()
 
     # 1) Match by radio value
@@ -301,50 +388,29 @@ def click_radio_in_fieldset(
         if val == answer_norm:
             if r.is_selected():
                 return True
-            if _click_radio_via_label(driver, wait, fieldset, r):
+            if _click_radio_via_label(driver, wait, labels, r):
                 return True
             try:
-                scroll_into_view(driver, r)
-                wait.until(ec.element_to_be_clickable(r)).click()
-            except (ElementClickInterceptedException, TimeoutException):
-                try:
-                    driver.execute_script("arguments[0].click();", r)
-                except Exception:
-                    driver.execute_script("arguments[0].focus();", r)
-                    r.send_keys(Keys.SPACE)
+                _fast_click(driver, wait, r)
+            except Exception:
+                driver.execute_script("arguments[0].focus();", r)
+                r.send_keys(Keys.SPACE)
             return True
 
-    # Build label map once
-    labels: Dict[str, Tuple[WebElement, str]] = {
-        lab.get_attribute("for"): (lab, (lab.text or "").strip().lower())
-        for lab in fieldset.find_elements(By.TAG_NAME, ElementsEnum.LABEL)
-        if lab.get_attribute("for")
-    }
-
     # 2) Exact label text match
     for r in radios:
         rid = r.get_attribute("id")
         if rid in labels and labels[rid][1] == answer_norm:
             if r.is_selected():
                 return True
-            label = labels[rid][0]
-            scroll_into_view(driver, label)
-            try:
-                wait.until(ec.element_to_be_clickable(label)).click()
-            except (ElementClickInterceptedException, TimeoutException):
-                driver.execute_script("arguments[0].click();", label)
+            _fast_click(driver, wait, labels[rid][0])
             return True
 
     # 3) Contains label text match
     for r in radios:
         rid = r.get_attribute("id")
         if rid in labels and answer_norm in labels[rid][1]:
-            label = labels[rid][0]
-            scroll_into_view(driver, label)
-            try:
-                wait.until(ec.element_to_be_clickable(label)).click()
-            except (ElementClickInterceptedException, TimeoutException):
-                driver.execute_script("arguments[0].click();", label)
+            _fast_click(driver, wait, labels[rid][0])
             return True
 
     return False
@@ -359,12 +425,7 @@ def _click_checkbox_label(
     rid = input_el.get_attribute("id")
     if not rid or rid not in labels:
         return False
-    label_el = labels[rid][0]
-    scroll_into_view(driver, label_el)
-    try:
-        wait.until(ec.element_to_be_clickable(label_el)).click()
-    except (ElementClickInterceptedException, TimeoutException):
-        driver.execute_script("arguments[0].click();", label_el)
+    _fast_click(driver, wait, labels[rid][0])
     return True
 
 
@@ -375,18 +436,16 @@ def set_checkboxes_in_fieldset(
     answer: Any,
     *,
     unselect_others: bool = False,
+    checkboxes: Optional[List[WebElement]] = None,
 ) -> bool:
     if answer is None or str(answer).strip() == "":
         return False
 
     desired = normalize_multi_answer(answer)
-    checkboxes = fieldset.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_CHECKBOX)
+    if checkboxes is None:
+        checkboxes = fieldset.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_CHECKBOX)
 
-    labels: Dict[str, Tuple[WebElement, str]] = {
-        lab.get_attribute("for"): (lab, (lab.text or "").strip().lower())
-        for lab in fieldset.find_elements(By.TAG_NAME, ElementsEnum.LABEL)
-        if lab.get_attribute("for")
-    }
+    labels = _fieldset_label_map(driver, fieldset)
 
     changed = False
     seen_target = False
@@ -418,11 +477,7 @@ def set_checkboxes_in_fieldset(
         for cb in candidates:
             if not cb.is_selected():
                 if not _click_checkbox_label(driver, wait, labels, cb):
-                    scroll_into_view(driver, cb)
-                    try:
-                        wait.until(ec.element_to_be_clickable(cb)).click()
-                    except (ElementClickInterceptedException, TimeoutException):
-                        driver.execute_script("arguments[0].click();", cb)
+                    _fast_click(driver, wait, cb)
                 changed = True
 
     # Optionally uncheck everything else
@@ -437,11 +492,7 @@ def set_checkboxes_in_fieldset(
             )
             if cb.is_selected() and not is_desired:
                 if not _click_checkbox_label(driver, wait, labels, cb):
-                    scroll_into_view(driver, cb)
-                    try:
-                        wait.until(ec.element_to_be_clickable(cb)).click()
-                    except (ElementClickInterceptedException, TimeoutException):
-                        driver.execute_script("arguments[0].click();", cb)
+                    _fast_click(driver, wait, cb)
                 changed = True
 
     return seen_target or changed
@@ -458,33 +509,30 @@ def handle_input(driver, el: WebElement, answer: Any) -> None:
     if input_type == "checkbox":
         should_check = is_truthy(answer)
         if should_check != el.is_selected():
-            scroll_into_view(driver, el)
-            el.click()
+            _click_or_scroll_and_click(driver, el)
         return
 
     if input_type == "radio":
         # Rare: bare radio not inside fieldset
         val = (el.get_attribute("value") or "").strip().lower()
         if val == str(answer).strip().lower() and not el.is_selected():
-            scroll_into_view(driver, el)
-            el.click()
+            _click_or_scroll_and_click(driver, el)
         return
 
     # Text-like inputs (text, email, date, number, etc.)
-    scroll_into_view(driver, el)
+    if not needs_keystrokes(el):
+        js_set_value(driver, el, str(answer))
+        return
+
     el.clear()
     el.send_keys(str(answer))
 
-    # Quirk: close potential role=combobox overlay if present
+    # Quirk: close potential role=combobox overlay by clicking the modal, in one round-trip
     if el.get_attribute("role") == ElementsEnum.ROLE_COMBOBOX:
-        try:
-            driver.find_element(By.CSS_SELECTOR, ElementsEnum.MODAL).click()
-        except Exception:
-            pass
+        js_click_if_present(driver, ElementsEnum.MODAL)
 
 
 def handle_select(driver, el: WebElement, answer: Any) -> None:
-    scroll_into_view(driver, el)
     sel = Select(el)
     ans = str(answer)
     try:
@@ -494,19 +542,19 @@ def handle_select(driver, el: WebElement, answer: Any) -> None:
 
 
 def handle_textarea(driver, el: WebElement, answer: Any) -> None:
-    scroll_into_view(driver, el)
-    el.clear()
-    el.send_keys(str(answer))
+    js_set_value(driver, el, str(answer))
 
 
 def handle_fieldset(driver, wait: WebDriverWait, el: WebElement, answer: Any) -> None:
-    has_radio = el.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_RADIO)
-    has_checkbox = el.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_CHECKBOX)
+    # The fetched inputs are handed to the helpers so they don't query them again
+    radios = el.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_RADIO)
+    if radios:
+        click_radio_in_fieldset(driver, wait, el, str(answer), radios=radios)
+        return
 
-    if has_radio:
-        click_radio_in_fieldset(driver, wait, el, str(answer))
-    elif has_checkbox:
-        set_checkboxes_in_fieldset(driver, wait, el, answer, unselect_others=False)
+    checkboxes = el.find_elements(By.CSS_SELECTOR, ElementsEnum.INPUT_CHECKBOX)
+    if checkboxes:
+        set_checkboxes_in_fieldset(driver, wait, el, answer, unselect_others=False, checkboxes=checkboxes)
 
 
 def handle_generic_editable(driver, el: WebElement, answer: Any) -> None:
@@ -519,3 +567,72 @@ def handle_generic_editable(driver, el: WebElement, answer: Any) -> None:
     except Exception:
         # No-op if not supported
         pass
+
+
+# ==========================================
+# Bulk filling
+# ==========================================
+
+BULK_FILL_JS = (
+    SET_NATIVE_VALUE_FN
+    + """
+return arguments[0].map((op) => {
+  const el = document.getElementById(op.id);
+  if (!el) return {id: op.id, tag: null, type: null, done: false};
+
+  const tag = el.tagName.toLowerCase();
+  let type = (el.getAttribute('type') || '').toLowerCase() || tag;
+  if (tag === 'fieldset') {
+    if (el.querySelector('input[type="radio"]')) type = 'radio';
+    else if (el.querySelector('input[type="checkbox"]')) type = 'checkbox-group';
+  }
+  const out = (done) => ({id: op.id, tag: tag, type: type, done: done});
+
+  if (op.value === null) return out(true);
+  const wanted = op.value.trim().toLowerCase();
+
+  if (tag === 'select') {
+    const opt = [...el.options].find((o) => o.text.trim() === op.value || o.value === op.value);
+    if (!opt) return out(false);
+    setNativeValue(el, opt.value);
+    return out(true);
+  }
+
+  if (tag === 'textarea') {
+    setNativeValue(el, op.value);
+    return out(true);
+  }
+
+  if (tag === 'input') {
+    if (type === 'checkbox') {
+      if (el.checked !== ['true', 'yes', '1', 'on'].includes(wanted)) el.click();
+      return out(true);
+    }
+    if (type === 'radio') {
+      if ((el.value || '').trim().toLowerCase() === wanted && !el.checked) el.click();
+      return out(true);
+    }
+    if (el.getAttribute('role') === 'combobox' || el.getAttribute('aria-autocomplete')) {
+      return out(false);
+    }
+    setNativeValue(el, op.value);
+    return out(true);
+  }
+
+  return out(false);
+});
+"""
+)
+
+
+def bulk_fill(driver, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fill every simple field of a form in a single execute_script call.
+
+    Each op is ``{"id": ..., "value": str | None}``. Returns one outcome per op,
+    ``{"id", "tag", "type", "done"}``; ops with ``done=False`` (fieldsets, autocomplete
+    inputs, unmatched select options, missing elements) need the per-element handlers.
+    """
+    if not ops:
+        return []
+    return driver.execute_script(BULK_FILL_JS, ops)
@@ -1,34 +1,107 @@
 # bot/helpers/page_load.py
 
+import random
 import time
-from typing import Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from loguru import logger
 from selenium import webdriver
 
 Locator = Tuple[str, str]
 
-
-def _any_visible(driver: webdriver.Remote, locator: Locator) -> bool:
-    by, value = locator
+# First poll delay; it grows by _POLL_GROWTH up to the caller's ``poll`` so fast pages are noticed quickly
+_FIRST_POLL = 0.05
+_POLL_GROWTH = 1.5
+_POLL_JITTER = 0.1
+
+
+PAGE_STATUS_JS = """
+const visible = (e) =>
+  !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length) && getComputedStyle(e).visibility !== 'hidden';
+const find = (by, value) => {
+  switch (by) {
+    case 'xpath': {
+      const r = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      return Array.from({length: r.snapshotLength}, (_, i) => r.snapshotItem(i));
+    }
+    case 'id': return [...document.querySelectorAll('#' + CSS.escape(value))];
+    case 'class name': return [...document.getElementsByClassName(value)];
+    case 'tag name': return [...document.getElementsByTagName(value)];
+    case 'name': return [...document.getElementsByName(value)];
+    case 'link text': return [...document.links].filter((a) => a.innerText.trim() === value);
+    case 'partial link text': return [...document.links].filter((a) => a.innerText.includes(value));
+    default: return [...document.querySelectorAll(value)];
+  }
+};
+const requireDisplayed = arguments[1];
+const visibleFlags = arguments[0].map(([by, value]) => {
+  try {
+    // CSS and id locators probe the first match before paying for a full scan
+    if (by === 'css selector' || by === 'id') {
+      const e = by === 'id' ? document.getElementById(value) : document.querySelector(value);
+      if (!e) return false;
+      if (!requireDisplayed || visible(e)) return true;
+    }
+    const hits = find(by, value);
+    return requireDisplayed ? hits.some(visible) : hits.length > 0;
+  } catch (e) {
+    return false;
+  }
+});
+return [document.readyState, visibleFlags];
+"""
+
+
+def _page_status(
+    driver: webdriver.Remote, locators: List[Locator], require_displayed: bool = True
+) -> Tuple[Optional[str], List[bool]]:
+    """
+    ``document.readyState`` and, for every locator, whether any matching element is visible
+    (or merely present when ``require_displayed`` is False); one round-trip for both.
+    """
     try:
-        elems = driver.find_elements(by, value)
-        return any(e.is_displayed() for e in elems)
+        state, flags = driver.execute_script(PAGE_STATUS_JS, [list(loc) for loc in locators], require_displayed)
+        return state, flags
     except Exception:
-        return False
+        return None, [False] * len(locators)
 
 
-def _all_visible(driver: webdriver.Remote, locators: Iterable[Locator]) -> bool:
-    return all(_any_visible(driver, loc) for loc in locators)
+def _wait_until(
+    driver: webdriver.Remote,
+    condition: Callable[[webdriver.Remote], bool],
+    *,
+    deadline: float,
+    poll: float,
+    warn_every: float,
+    on_warn: Callable[[], None],
+    on_timeout: Callable[[], Exception],
+) -> None:
+    """
+    Polls ``condition`` until the monotonic ``deadline`` with a jittered delay growing from ``_FIRST_POLL``
+    up to ``poll``, calling ``on_warn`` every ``warn_every`` seconds and raising ``on_timeout()``
+    when time runs out.
+    """
+    delay = min(_FIRST_POLL, poll)
+    next_warn = time.monotonic() + warn_every
+    while not condition(driver):
+        now = time.monotonic()
+        if now >= deadline:
+            raise on_timeout()
+        if now >= next_warn:
+            on_warn()
+            next_warn = now + warn_every
+        time.sleep(min(delay + random.uniform(0, delay * _POLL_JITTER), deadline - now))
+        delay = min(delay * _POLL_GROWTH, poll)
 
 
 def get_and_wait_until_loaded(
     driver: webdriver.Remote,
     url: str,
     *,
-    poll: float = 0.25,
+    poll: float = 0.5,
     wait_for: Optional[Locator] = None,
     wait_for_all: Optional[Iterable[Locator]] = None,
+    require_displayed: bool = True,
 ) -> None:
     warn_every = 30
     timeout = 60
@@ -36,46 +109,38 @@ def get_and_wait_until_loaded(
     driver.get(url)
     start = time.monotonic()
     context = url
-    next_warn_at = start + warn_every
     deadline = start + timeout
 
-    while True:
-        now = time.monotonic()
-        try:
-            state = driver.execute_script("return document.readyState")
-        except Exception:
-            state = None
-
-        if state == "complete":
-            break
-
-        if now >= next_warn_at:
-            logger.warning(f"⏳ [{context}] Waiting for readyState='complete' ({now - start:.1f}s, state={state!r})")
-            next_warn_at += warn_every
-
-        if now >= deadline:
-            raise TimeoutError(f"[{context}] ❌ Page did not load after {timeout}s (last state={state!r})")
-
-        time.sleep(poll)
-
-    # Waiting for visibility
-    next_warn_at = time.monotonic() + warn_every
-    if wait_for or wait_for_all:
-        while True:
-            now = time.monotonic()
-
-            ok = _any_visible(driver, wait_for) if wait_for else _all_visible(driver, wait_for_all)
-
-            if ok:
-                return
-
-            if now >= next_warn_at:
-                detail = f"locator={wait_for!r}" if wait_for else f"locators={list(wait_for_all)!r}"
-                logger.warning(f"⏳ [{context}] Page loaded but waiting for visible element(s): {detail}")
-                next_warn_at += warn_every
-
-            if now >= deadline:
-                detail = f"locator={wait_for!r}" if wait_for else f"locators={list(wait_for_all)!r}"
-                raise TimeoutError(f"[{context}] ❌ Element(s) not visible in time: {detail}")
-
-            time.sleep(poll)
+    # readyState and visibility are checked together, one script call per poll
+    locators = [wait_for] if wait_for else list(wait_for_all or ())
+    wanted = any if wait_for else all
+    detail = f"locator={wait_for!r}" if wait_for else f"locators={locators!r}"
+    status: Dict[str, Any] = {"state": None}
+
+    def ready(d: webdriver.Remote) -> bool:
+        status["state"], flags = _page_status(d, locators, require_displayed)
+        return status["state"] == "complete" and wanted(flags)
+
+    def on_warn() -> None:
+        if status["state"] != "complete":
+            logger.warning(
+                f"⏳ [{context}] Waiting for readyState='complete' "
+                f"({time.monotonic() - start:.1f}s, state={status['state']!r})"
+            )
+        else:
+            logger.warning(f"⏳ [{context}] Page loaded but waiting for visible element(s): {detail}")
+
+    def on_timeout() -> Exception:
+        if status["state"] != "complete":
+            return TimeoutError(f"[{context}] ❌ Page did not load after {timeout}s (last state={status['state']!r})")
+        return TimeoutError(f"[{context}] ❌ Element(s) not visible in time: {detail}")
+
+    _wait_until(
+        driver,
+        ready,
+        deadline=deadline,
+        poll=poll,
+        warn_every=warn_every,
+        on_warn=on_warn,
+        on_timeout=on_timeout,
+    )
@@ -1,6 +1,31 @@
+from typing import Any, Dict, List
+
 from selenium.webdriver.common.by import By
 
 from bot.enums import ElementsEnum
+from bot.helpers.dom_utils import present_flags
+
+_JOB_CARD_SELECTORS = {
+    "offsite_icon": ElementsEnum.OFFSITE_APPLY_ICON.value,
+    "sign_in_modal": ElementsEnum.SIGN_IN_MODAL.value,
+}
+
+NO_RESULTS_TEXT = "Please make sure your keywords are spelled correctly"
+
+# Everything process_page branches on, read in one round-trip; job_item_count is null without a results list
+SEARCH_PAGE_STATE_JS = """
+const list = document.getElementsByClassName(arguments[2])[0];
+return {
+  has_modal: !!document.querySelector(arguments[0]),
+  has_no_results: !!document.body && document.body.innerText.includes(arguments[1]),
+  job_item_count: list ? list.children.length : null,
+};
+"""
+
+BODY_TEXT_FLAGS_JS = """
+const text = document.body ? document.body.innerText : '';
+return arguments[0].map((t) => text.includes(t));
+"""
 
 
 def has_exhausted_limit(driver) -> bool:
@@ -12,14 +37,28 @@ def has_exhausted_limit(driver) -> bool:
     return bool(driver.find_elements(By.XPATH, xpath))
 
 
-def has_offsite_apply_icon(driver) -> bool:
-    return bool(driver.find_elements(By.CSS_SELECTOR, ElementsEnum.OFFSITE_APPLY_ICON))
+def job_card_state(driver) -> Dict[str, bool]:
+    """Offsite-apply icon and sign-in modal presence after opening a job card, in one round-trip."""
+    return present_flags(driver, _JOB_CARD_SELECTORS)
 
 
 def body_has_text(driver, text: str) -> bool:
-    body = driver.find_element(By.TAG_NAME, "body")
-    return text in body.text
+    return body_text_flags(driver, [text])[0]
+
+
+def body_text_flags(driver, texts: List[str]) -> List[bool]:
+    """For every text, whether the page body contains it; matched in the page so the body text never crosses the wire."""
+    return driver.execute_script(BODY_TEXT_FLAGS_JS, texts)
 
 
 def navigated_to_single_page(driver) -> bool:
     return body_has_text(driver, "People also viewed")
+
+
+def search_page_state(driver) -> Dict[str, Any]:
+    return driver.execute_script(
+        SEARCH_PAGE_STATE_JS,
+        ElementsEnum.SIGN_IN_MODAL.value,
+        NO_RESULTS_TEXT,
+        ElementsEnum.JOB_ITEMS.value,
+    )
@@ -1,5 +1,7 @@
+import random
 import time
 from contextlib import suppress
+from typing import Optional
 
 
 def click_with_rate_limit_checking(driver, job_item, delay=2) -> bool:
@@ -31,3 +33,20 @@ def click_with_rate_limit_checking(driver, job_item, delay=2) -> bool:
 
     time.sleep(delay * 2)
     return False
+
+
+class MinIntervalPacer:
+    """
+    Keeps calls at least ``interval`` seconds apart, plus up to ``jitter`` seconds of random delay;
+    time the caller already spent since the previous call counts towards the interval.
+    """
+
+    def __init__(self, interval: float, jitter: float = 1.0):
+        self.interval = interval
+        self.jitter = jitter
+        self._last: Optional[float] = None
+
+    def acquire(self) -> None:
+        needed = 0.0 if self._last is None else self.interval - (time.monotonic() - self._last)
+        time.sleep(max(0.0, needed) + random.uniform(0, self.jitter))
+        self._last = time.monotonic()
@@ -9,16 +9,36 @@ from selenium.common import (
 )
 
 
-def safe_find_element(driver, by, value, *, retries=3, delay=1):
-    for attempt in range(retries):
+def safe_find_element(driver, by, value, *, timeout=3):
+    # Implicit wait only for this lookup: the driver polls for the element itself instead of us re-sending find_element
+    driver.implicitly_wait(timeout)
+    try:
+        return driver.find_element(by, value)
+    except NoSuchElementException:
+        logger.warning("⚠️ Element not found: {}", value)
+    finally:
+        driver.implicitly_wait(0)
+    return None
+
+
+def with_refreshed(driver, locator, action, *, element=None, retries=2):
+    """
+    Runs ``action(element)``; when the element goes stale, re-finds only it by ``locator`` and retries,
+    instead of re-running the whole surrounding step.
+    """
+    for attempt in range(retries + 1):
+        if element is None:
+            element = safe_find_element(driver, *locator)
+            if element is None:
+                return None
         try:
-            return driver.find_element(by, value)
-        except NoSuchElementException:
-            if attempt == retries - 1:
-                logger.warning(f"⚠️ Element not found: {value}")
+            return action(element)
         except StaleElementReferenceException:
-            logger.debug("♻️ Retrying stale element...")
-        time.sleep(delay)
+            if attempt == retries:
+                break
+            logger.debug("♻️ Stale element, re-finding {} ({}/{})...", locator[1], attempt + 1, retries)
+            element = None
+    logger.warning("⚠️ Element kept going stale: {}", locator[1])
     return None
 
 
@@ -27,10 +47,10 @@ def safe_action(fn, name="unknown_action", retries=2, delay=2):
         try:
             return fn()
         except (StaleElementReferenceException, TimeoutException) as e:
-            logger.warning(f"⚠️ {type(e).__name__} during {name}, retrying...")
+            logger.warning("⚠️ {} during {}, retrying...", type(e).__name__, name)
         except WebDriverException as e:
-            logger.error(f"❌ WebDriver error during {name}: {e}")
+            logger.error("❌ WebDriver error during {}: {}", name, e)
         time.sleep(delay * (attempt + 1))
 
-    logger.error(f"❌ Giving up {name} after {retries} retries.")
+    logger.error("❌ Giving up {} after {} retries.", name, retries)
     return None
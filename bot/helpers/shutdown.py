@@ -0,0 +1,21 @@
+import os
+import signal
+import sys
+
+from loguru import logger
+
+
+def exit_on_sigterm() -> None:
+    """Turn SIGTERM into SystemExit so ``finally`` blocks still close Chrome and the DB when the bot is killed."""
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+
+def exit_now(code: int = 0) -> None:
+    """
+    End the process without interpreter teardown; only call once drivers and DB sessions are closed.
+    Logs and stdio are flushed first since ``os._exit`` skips that.
+    """
+    logger.complete()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
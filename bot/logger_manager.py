@@ -13,6 +13,7 @@ def setup_logger():
     - Creates a logs directory if not exists.
     - Adds both file and console handlers.
     - Enables daily rotation and retention.
+    - Writes from a background thread so logging never blocks driver commands.
     """
     # Create log directory if missing
     if not os.path.exists(settings.LOG_DIR):
@@ -28,11 +29,15 @@ def setup_logger():
         retention="7 days",  # Keep logs for 7 days
         level="INFO",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        enqueue=True,
     )
 
     # Console handler with colored output
     logger.add(
-        lambda msg: print(msg, end=""), level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>"
+        lambda msg: print(msg, end=""),
+        level="INFO",
+        format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>",
+        enqueue=True,
     )
 
     logger.info("📋 Logger initialized successfully.")
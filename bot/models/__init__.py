@@ -1,4 +1,6 @@
+from .ai_answer import AiAnswer
 from .base import Base
+from .embedding_cache import EmbeddingCache
 from .field import Field
 from .field_job import FieldJob
 from .job import Job
@@ -8,4 +10,6 @@ __all__ = (
     "Job",
     "Field",
     "FieldJob",
+    "AiAnswer",
+    "EmbeddingCache",
 )
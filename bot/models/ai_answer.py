@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String, Text
+
+from bot.models.base import Base
+
+
+class AiAnswer(Base):
+    __tablename__ = "ai_answers"
+
+    key = Column(String(64), primary_key=True)  # sha256 of the normalized label
+    label = Column(Text)
+    answer = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,14 @@
+from sqlalchemy import select
+
+from bot.models import AiAnswer
+
+
+class AiAnswerRepository:
+    def get_many(self, session, keys):
+        if not keys:
+            return {}
+        rows = session.execute(select(AiAnswer).where(AiAnswer.key.in_(keys))).scalars()
+        return {row.key: row.answer for row in rows}
+
+    def save(self, session, key, label, answer):
+        return session.merge(AiAnswer(key=key, label=label, answer=answer))
@@ -0,0 +1,14 @@
+from sqlalchemy import select
+
+from bot.models import EmbeddingCache
+
+
+class EmbeddingCacheRepository:
+    def get_many(self, session, keys):
+        if not keys:
+            return {}
+        rows = session.execute(select(EmbeddingCache).where(EmbeddingCache.key.in_(keys))).scalars()
+        return {row.key: row.vector for row in rows}
+
+    def save(self, session, key, vector):
+        return session.merge(EmbeddingCache(key=key, vector=vector))
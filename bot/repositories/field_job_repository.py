@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from bot.models import FieldJob
 
@@ -16,3 +16,7 @@ class FieldJobRepository:
         fj = FieldJob(job_id=job_id, field_id=field_id)
         session.add(fj)
         return fj
+
+    def insert_many(self, session, job_id, field_ids):
+        if field_ids:
+            session.execute(insert(FieldJob), [{"job_id": job_id, "field_id": field_id} for field_id in field_ids])
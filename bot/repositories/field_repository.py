@@ -1,6 +1,6 @@
-import numpy as np
 from sqlalchemy import select
 
+from bot.helpers.embedding_codec import quantize
 from bot.models import Field
 
 
@@ -13,13 +13,32 @@ class FieldRepository:
             label=label,
             value=value,
             type=type,
-            embedding=np.array(embeddings, dtype=np.float32).tobytes(),
+            embedding=quantize(embeddings),
         )
         session.add(field)
         return field
 
+    def insert_many(self, session, rows):
+        """Adds all rows and flushes once (one batched INSERT ... RETURNING) so their ids are available."""
+        fields = [
+            Field(
+                label=row["label"],
+                value=row["value"],
+                type=row["type"],
+                embedding=quantize(row["embeddings"]),
+            )
+            for row in rows
+        ]
+        session.add_all(fields)
+        session.flush()
+        return fields
+
     def get_all(self, session):
         return session.query(Field).all()
 
+    def get_all_embeddings(self, session):
+        """Lightweight (id, value, embedding) rows for similarity matching, without ORM entity loading."""
+        return session.execute(select(Field.id, Field.value, Field.embedding).order_by(Field.id)).all()
+
     def get_by_label(self, session, label):
         return session.execute(select(Field).where(Field.label == label)).scalar_one_or_none()
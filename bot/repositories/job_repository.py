@@ -1,17 +1,25 @@
-from sqlalchemy import or_, select, update
+from typing import Iterator
+
+from sqlalchemy import insert, or_, select, update
 
 from bot.enums import JobStatusEnum
 from bot.models import Job
 
+# Built once; SQLAlchemy's compiled cache then reuses its SQL for every saved job
+_INSERT_JOB = insert(Job)
+
 
 class JobRepository:
     def exists(self, session, job_id: str) -> bool:
         return session.execute(select(Job).where(Job.job_id == job_id)).scalar_one_or_none() is not None
 
-    def insert(self, session, **data) -> Job:
-        job = Job(**data)
-        session.add(job)
-        return job
+    def existing_job_ids(self, session, job_ids) -> set:
+        if not job_ids:
+            return set()
+        return set(session.execute(select(Job.job_id).where(Job.job_id.in_(job_ids))).scalars())
+
+    def insert(self, session, **data) -> None:
+        session.execute(_INSERT_JOB, data)
 
     def get_by_id(self, session, *, job_id=None, pk=None):
         q = session.query(Job)
@@ -19,21 +27,37 @@ class JobRepository:
             return q.filter(Job.job_id == job_id).first()
         return q.filter(Job.id == pk).first()
 
-    def get_not_applied(self, session):
-        return (
-            session.query(Job)
-            .filter(
-                or_(
-                    Job.status == JobStatusEnum.FILL_OUT_FORM,
-                    Job.status == JobStatusEnum.APPLY_BUTTON,
-                    Job.status.is_(None),
-                )
-            )
-            .all()
+    def get_not_applied(self, session, batch_size: int = 100) -> Iterator[Job]:
+        return self._iter_jobs(
+            session,
+            or_(
+                Job.status == JobStatusEnum.FILL_OUT_FORM,
+                Job.status == JobStatusEnum.APPLY_BUTTON,
+                Job.status.is_(None),
+            ),
+            batch_size,
         )
 
-    def get_ready_for_apply(self, session):
-        return session.query(Job).filter(Job.status == JobStatusEnum.READY_FOR_APPLY).all()
+    def get_ready_for_apply(self, session, batch_size: int = 100) -> Iterator[Job]:
+        return self._iter_jobs(session, Job.status == JobStatusEnum.READY_FOR_APPLY, batch_size)
+
+    @staticmethod
+    def _iter_jobs(session, condition, batch_size: int) -> Iterator[Job]:
+        """
+        Streams matching jobs in id order, one keyset-paginated query per batch,
+        so callers can commit (e.g. status updates) between rows.
+        """
+        last_id = 0
+        while True:
+            batch = (
+                session.execute(select(Job).where(condition, Job.id > last_id).order_by(Job.id).limit(batch_size))
+                .scalars()
+                .all()
+            )
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
 
     def update_status(self, session, pk, status):
         session.execute(update(Job).where(Job.id == pk).values(status=status))
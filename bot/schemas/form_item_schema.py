@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -7,7 +9,7 @@ class FormItemSchema:
     label: str
     answer: str = ""
     type: str = ""
-    embeddings: bytes = b""  # float32 bytes
+    embeddings: Optional[np.ndarray] = None  # float32 vector; serialized only when stored
 
     @staticmethod
     def from_payload_entry(entry: Dict[str, str]) -> "FormItemSchema":
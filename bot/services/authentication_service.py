@@ -1,9 +1,7 @@
-import random
-import time
-
 from loguru import logger
-from selenium.common import WebDriverException
+from selenium.common import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
 
 from bot.helpers.dom_utils import click_if_exists
 from bot.helpers.page_load import get_and_wait_until_loaded
@@ -28,9 +26,8 @@ class AuthenticationService:
 
         safe_action(lambda: get_and_wait_until_loaded(self.driver, login_url), "load_login_page")
 
-        # --- Already logged in?
-        current_url = self.driver.current_url
-        if any(k in current_url for k in ("feed", "notifications", "jobs")):
+        # --- Redirected away from the login page by a persisted session?
+        if self.is_logged_in():
             logger.info("✅ Already logged in.")
             return
 
@@ -65,7 +62,12 @@ class AuthenticationService:
             logger.warning("⚠️ Login button not found.")
 
         # --- Wait and confirm login
-        time.sleep(settings.DELAY_TIME + random.uniform(1, 2))
+        try:
+            WebDriverWait(self.driver, settings.DELAY_TIME).until(
+                lambda d: self.is_logged_in() or "checkpoint" in d.current_url
+            )
+        except TimeoutException:
+            pass
 
         if self.is_logged_in():
             logger.success("✅ Login successful.")
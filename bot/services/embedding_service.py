@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 import numpy as np
+import orjson
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from bot.helpers import embedding_codec
 from bot.schemas import FormItemSchema
 from bot.settings import settings
 
@@ -13,6 +17,16 @@ from bot.settings import settings
 class EmbeddingService:
     _SESSION = None
     _TIMEOUT = 60
+    _BATCH_SIZE = 64
+    # Similarity search: below n*m of _DENSE_LIMIT score densely, above it in early-exit tiles
+    _DENSE_LIMIT = 10_000
+    _Q_TILE = 64
+    _H_TILE = 512
+    _EPS = 1e-12
+    _SIMSIMD = None  # optional SIMD backend for dense scoring; False once found missing
+    # Stored fields never change: their normalized matrix is kept as (field ids, matrix, kept indices)
+    # and only rows appended since the last call are decoded and normalized.
+    _HIST_CACHE: Optional[Tuple[Tuple[int, ...], np.ndarray, List[int]]] = None
 
     @staticmethod
     def get_embedding(text: str) -> List[float]:
@@ -20,25 +34,41 @@ class EmbeddingService:
         Best-practice embedding fetch (non-agent).
         Returns [] on failure.
         """
-        try:
-            resp = EmbeddingService._session().post(
-                settings.DEEPINFRA_EMBEDDING_API_URL,
-                json={"inputs": [text]},
-                timeout=EmbeddingService._TIMEOUT,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        return EmbeddingService.get_embeddings([text])[0]
+
+    @staticmethod
+    def get_embeddings(texts: List[str]) -> List[List[float]]:
+        """
+        Embeds all texts with one request per chunk of _BATCH_SIZE inputs.
+        Returns one vector per text, in order; [] for texts whose chunk failed.
+        """
+        results: List[List[float]] = []
+        for start in range(0, len(texts), EmbeddingService._BATCH_SIZE):
+            chunk = texts[start : start + EmbeddingService._BATCH_SIZE]
+            try:
+                resp = EmbeddingService._session().post(
+                    settings.DEEPINFRA_EMBEDDING_API_URL,
+                    json={"inputs": chunk},
+                    timeout=EmbeddingService._TIMEOUT,
+                )
+                resp.raise_for_status()
+                # Responses are large float arrays; orjson parses them several times faster than json
+                data = orjson.loads(resp.content)
+
+                # DeepInfra returns {"embeddings": [[...], ...]} or {"embeddings": [...]} for a single input
+                emb = data.get("embeddings", [])
+                if emb and not isinstance(emb[0], list):
+                    emb = [emb]
+                if len(emb) != len(chunk):
+                    raise ValueError(f"expected {len(chunk)} embeddings, got {len(emb)}")
 
-            # DeepInfra returns {"embeddings": [[...]]} or {"embeddings": [...]}
-            emb = data.get("embeddings", [])
-            if isinstance(emb, list) and len(emb) == 1:
-                return emb[0]  # unwrap the 2D list
+                results.extend(emb)
 
-            return emb
+            except Exception as e:
+                logger.warning(f"⚠️ Embedding fetch failed: {e}")
+                results.extend([] for _ in chunk)
 
-        except Exception as e:
-            logger.warning(f"⚠️ Embedding fetch failed: {e}")
-            return []
+        return results
 
     @classmethod
     def _session(cls) -> requests.Session:
@@ -50,6 +80,13 @@ class EmbeddingService:
                     "Authorization": f"Bearer {settings.DEEPINFRA_API_KEY}",
                 }
             )
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"POST"}),
+            )
+            cls._SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
         return cls._SESSION
 
     @staticmethod
@@ -59,48 +96,149 @@ class EmbeddingService:
         using cosine similarity on embeddings. Operates in-place.
         """
 
-        # Build matrices: query (n x d) and historical (m x d), keeping row indices
-        q_mat, kept_q = EmbeddingService._stack_embeddings([i.embeddings for i in items])  # (n, d)
-        h_mat, kept_h = EmbeddingService._stack_embeddings([f.embedding for f in historical])  # (m, d)
-
-        if q_mat.size == 0 or h_mat.size == 0:
+        # Build matrices: query (n x d) and L2-normalized historical (m x d), keeping row indices
+        q_mat, kept_q = EmbeddingService._stack_vectors([i.embeddings for i in items])  # (n, d)
+        if q_mat.size == 0:
             return
 
-        # Cosine similarity matrix (n x m)
-        sim = EmbeddingService._cosine_similarity_matrix(q_mat, h_mat)  # values in [-1, 1]
+        # Only compare against history of the same dimension (older rows may come from another embedding model)
+        dim = q_mat.shape[1]
+        same_dim = [j for j, f in enumerate(historical) if embedding_codec.blob_dim(f.embedding) == dim]
+        h_norm, kept_h = EmbeddingService._normalized_history([historical[j] for j in same_dim])  # (m, d)
+        if h_norm.size == 0:
+            return
 
         # For each query, take the best historical match
-        best_idx = sim.argmax(axis=1)  # (n,)
-        best_scores = sim[np.arange(sim.shape[0]), best_idx]  # (n,)
+        threshold = settings.SIMILARITY_THRESHOLD
+        best_idx, best_scores = EmbeddingService._best_matches(q_mat, h_norm, threshold)  # (n,)
 
-        for row_i, score in enumerate(best_scores):
-            if float(str(score)) >= settings.SIMILARITY_THRESHOLD:
-                # Map back to original indices
-                hist_j = kept_h[int(best_idx[row_i])]
-                item_i = kept_q[row_i]
-                items[item_i].answer = historical[hist_j].value
+        matched = np.flatnonzero(best_scores >= threshold)
+        for row_i in matched:
+            # Map back to original indices
+            hist_j = same_dim[kept_h[best_idx[row_i]]]
+            item_i = kept_q[row_i]
+            items[item_i].answer = historical[hist_j].value
+
+    @staticmethod
+    def _best_matches(q_mat: np.ndarray, h_norm: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Index and cosine score of the best historical row for every query row -> ((n,), (n,)).
+
+        Small inputs use one dense similarity matrix. Larger ones are scored in
+        (_Q_TILE x _H_TILE) tiles, and a query row stops being scored once it has a
+        match >= threshold, so it keeps the first match above the threshold rather
+        than the global best.
+        """
+        n, m = q_mat.shape[0], h_norm.shape[0]
+        if n * m < EmbeddingService._DENSE_LIMIT:
+            q = q_mat if np.isfinite(q_mat).all() else np.nan_to_num(q_mat, nan=0.0, posinf=0.0, neginf=0.0)
+            q_norms = np.linalg.norm(q, axis=1)
+            zero_rows = q_norms <= EmbeddingService._EPS
+
+            simsimd = EmbeddingService._simsimd()
+            if simsimd is not None:
+                # SIMD cosine kernels with fused norms; distance -> similarity
+                sim = 1.0 - np.asarray(simsimd.cdist(q, h_norm, metric="cosine"), dtype=np.float32)
+                best_idx = sim.argmax(axis=1)
+                best_scores = sim[np.arange(n), best_idx]
+            else:
+                # Scaling a query row does not change its argmax: score the raw queries
+                # and normalize only the n winning scores instead of a copy of the whole query matrix.
+                raw = q @ h_norm.T  # (n, m)
+                best_idx = raw.argmax(axis=1)
+                q_norms[zero_rows] = 1.0
+                best_scores = raw[np.arange(n), best_idx] / q_norms
+
+            best_scores[zero_rows] = 0.0
+            return best_idx, np.clip(best_scores, -1.0, 1.0, out=best_scores)
+
+        q_norm = EmbeddingService._normalize_rows(q_mat)
+        best_idx = np.zeros(n, dtype=np.intp)
+        best_scores = np.full(n, -np.inf, dtype=np.float32)
+
+        for q_start in range(0, n, EmbeddingService._Q_TILE):
+            rows = slice(q_start, q_start + EmbeddingService._Q_TILE)
+            q_tile, tile_idx, tile_scores = q_norm[rows], best_idx[rows], best_scores[rows]  # views
+
+            for h_start in range(0, m, EmbeddingService._H_TILE):
+                active = np.flatnonzero(tile_scores < threshold)
+                if active.size == 0:
+                    break
+
+                s = q_tile[active] @ h_norm[h_start : h_start + EmbeddingService._H_TILE].T
+                arg = s.argmax(axis=1)
+                top = s[np.arange(active.size), arg]
+
+                better = top > tile_scores[active]
+                tile_scores[active[better]] = top[better]
+                tile_idx[active[better]] = arg[better] + h_start
+
+        # Clip to [-1, 1] (protects against tiny numerical spillover)
+        np.clip(best_scores, -1.0, 1.0, out=best_scores)
+        return best_idx, best_scores
+
+    @classmethod
+    def _simsimd(cls):
+        """The optional SimSIMD module, imported on first use; None when it is not installed."""
+        if cls._SIMSIMD is None:
+            try:
+                import simsimd
+
+                cls._SIMSIMD = simsimd
+            except ImportError:
+                cls._SIMSIMD = False
+        return cls._SIMSIMD or None
+
+    @staticmethod
+    def _stack_vectors(vectors: Iterable[Optional[np.ndarray]]) -> Tuple[np.ndarray, List[int]]:
+        """
+        From in-memory float32 vectors -> (N, D) float32 array and the list of kept indices.
+        Missing or empty vectors, and vectors whose size differs from the first kept one, are skipped.
+        """
+        vectors = list(vectors)
+        kept = [idx for idx, v in enumerate(vectors) if v is not None and v.size]
+        if not kept:
+            return np.empty((0, 0), dtype=np.float32), []
+
+        dim = vectors[kept[0]].shape[0]
+        kept = [idx for idx in kept if vectors[idx].shape[0] == dim]
+        return np.stack([vectors[idx] for idx in kept]).astype(np.float32, copy=False), kept
 
     @staticmethod
     def _stack_embeddings(blobs: Iterable[bytes]) -> Tuple[np.ndarray, List[int]]:
         """
-        From an iterable of float32 byte blobs -> (N, D) float32 array and the list of kept indices.
+        From an iterable of byte blobs (float32 or int8-quantized) -> (N, D) float32 array and the list of kept indices.
 
         Returns:
             (array, kept_indices)
             - array: shape (N, D), dtype float32. Empty (0, 0) if no valid embeddings.
             - kept_indices: indices (into the input iterable order) of rows that were kept.
         """
-        arrays: List[Tuple[int, np.ndarray]] = []
-        for idx, b in enumerate(blobs):
-            # Tolerate None/missing blobs
-            if b is None:
-                continue
-            arr = np.frombuffer(b, dtype=np.float32)
-            arrays.append((idx, arr))
-
-        if not arrays:
+        blobs = list(blobs)
+        # Tolerate None/missing blobs
+        kept = [idx for idx, b in enumerate(blobs) if b is not None]
+        if not kept:
             return np.empty((0, 0), dtype=np.float32), []
 
+        # Fast path: every blob has the same size -> one join, one frombuffer, one reshape.
+        sizes = {len(blobs[idx]) for idx in kept}
+        if len(sizes) == 1:
+            size = sizes.pop()
+            if size == 0:
+                return np.empty((0, 0), dtype=np.float32), []
+            tagged = [blobs[idx][:4] == embedding_codec.Q8_TAG for idx in kept]
+            if all(tagged):
+                raw = np.frombuffer(b"".join(blobs[idx] for idx in kept), dtype=np.uint8).reshape(len(kept), size)
+                scales = raw[:, 4 : embedding_codec.Q8_HEADER].copy().view(np.float32)  # (N, 1)
+                mat = raw[:, embedding_codec.Q8_HEADER :].view(np.int8).astype(np.float32)
+                mat *= scales
+                return mat, kept
+            if not any(tagged) and size % 4 == 0:
+                buf = b"".join(blobs[idx] for idx in kept)
+                return np.frombuffer(buf, dtype=np.float32).reshape(len(kept), size // 4), kept
+
+        arrays = [(idx, embedding_codec.decode(blobs[idx])) for idx in kept]
+
         # Validate consistent dimensionality; if not, skip mismatched rows.
         dim = arrays[0][1].shape[0]
         filtered = [(idx, a) for idx, a in arrays if a.shape[0] == dim]
@@ -113,39 +251,49 @@ class EmbeddingService:
         return mat, list(kept_idx)
 
     @staticmethod
-    def _cosine_similarity_matrix(
-        a: np.ndarray, b: np.ndarray, *, out_dtype=np.float32, eps: float = 1e-12
-    ) -> np.ndarray:
+    def _normalized_history(historical: list) -> Tuple[np.ndarray, List[int]]:
         """
-        Pairwise cosine similarity between rows of A (n x d) and B (m x d) -> (n x m).
-        - Safe for zero or near-zero vectors (treated as all-zeros => similarity 0).
-        - Robust to int inputs and NaN/Inf values.
-        - Numerically stable (uses float64 inside).
+        Stacked, L2-normalized historical embeddings and their kept indices, cached by field ids.
+        When the ids only grew at the end (new fields were stored), just the new rows are normalized.
         """
-        # Normalize inputs to float64 for stability
-        a = np.asarray(a, dtype=np.float64)
-        b = np.asarray(b, dtype=np.float64)
+        key = tuple(f.id for f in historical)
+        cache = EmbeddingService._HIST_CACHE
+        if cache is not None and cache[0] == key:
+            return cache[1], cache[2]
 
-        # Replace NaN/Inf with finite numbers
-        a = np.nan_to_num(a, nan=0.0, posinf=0.0, neginf=0.0)
-        b = np.nan_to_num(b, nan=0.0, posinf=0.0, neginf=0.0)
+        prev_key, prev_norm, prev_kept = cache if cache is not None and cache[1].size else ((), None, [])
+        start = len(prev_key) if prev_key and key[: len(prev_key)] == prev_key else 0
 
-        # Row norms (n,1) and (m,1)
-        a_norms = np.linalg.norm(a, axis=1, keepdims=True)
-        b_norms = np.linalg.norm(b, axis=1, keepdims=True)
+        h_mat, kept_h = EmbeddingService._stack_embeddings([f.embedding for f in historical[start:]])
+        if start and h_mat.size and h_mat.shape[1] != prev_norm.shape[1]:
+            # Embedding size changed (new model): rebuild from scratch
+            start = 0
+            h_mat, kept_h = EmbeddingService._stack_embeddings([f.embedding for f in historical])
+        h_norm = EmbeddingService._normalize_rows(h_mat)
 
-        # Use np.divide with where to avoid boolean-indexing/broadcasting pitfalls.
-        # Unsafe rows (norm <= eps) are set to zero rows.
-        den_a = np.where(a_norms > eps, a_norms, 1.0)
-        den_b = np.where(b_norms > eps, b_norms, 1.0)
+        if start:
+            if h_norm.size:
+                h_norm = np.concatenate((prev_norm, h_norm))
+                kept_h = prev_kept + [start + idx for idx in kept_h]
+            else:
+                h_norm, kept_h = prev_norm, prev_kept
 
-        a_safe = np.divide(a, den_a, out=np.zeros_like(a), where=a_norms > eps)
-        b_safe = np.divide(b, den_b, out=np.zeros_like(b), where=b_norms > eps)
+        EmbeddingService._HIST_CACHE = (key, np.ascontiguousarray(h_norm), kept_h)
+        return EmbeddingService._HIST_CACHE[1], kept_h
 
-        # Cosine similarity
-        s = np.dot(a_safe, b_safe.T)
+    @staticmethod
+    def _normalize_rows(mat: np.ndarray) -> np.ndarray:
+        """
+        Float32 copy of ``mat`` with every row scaled to unit length.
+        - Zero or near-zero rows (norm <= _EPS) stay all-zeros.
+        - Robust to int inputs and NaN/Inf values.
+        """
+        mat = np.array(mat, dtype=np.float32)
 
-        # Clip to [-1, 1] (protects against tiny numerical spillover)
-        np.clip(s, -1.0, 1.0, out=s)
+        # Replace NaN/Inf with finite numbers
+        np.nan_to_num(mat, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
 
-        return s.astype(out_dtype, copy=False)
+        norms = np.linalg.norm(mat, axis=1)
+        norms[norms <= EmbeddingService._EPS] = 1.0
+        mat /= norms[:, None]
+        return mat
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional
 
 import numpy as np
 from loguru import logger
@@ -8,11 +10,11 @@ from selenium.common import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 
-from bot.agents import FormAnswerAgent
 from bot.enums import ElementsEnum, JobStatusEnum
 from bot.exceptions import JobApplyError
-from bot.helpers.dom_utils import click_if_exists, find_elements
+from bot.helpers.dom_utils import click_if_exists, find_elements, js_click_if_present, present_flags
 from bot.helpers.form_utils import (
+    bulk_fill,
     extract_checkbox_groups,
     extract_fields,
     extract_radio_groups,
@@ -23,6 +25,10 @@ from bot.helpers.form_utils import (
     handle_select,
     handle_textarea,
     infer_type,
+    scroll_all_into_view,
+    should_include_input,
+    should_include_select,
+    snapshot_form,
     wait_present_by_id,
 )
 from bot.models import Job
@@ -30,56 +36,86 @@ from bot.schemas import FormItemSchema
 from bot.services import EmbeddingService
 from bot.settings import settings
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Locators resolved once instead of per step
+NEXT_STEP_LOCATOR = (By.CSS_SELECTOR, ElementsEnum.NEXT_STEP_BUTTON.value)
+REVIEW_LOCATOR = (By.CSS_SELECTOR, ElementsEnum.REVIEW_BUTTON.value)
+DISMISS_LOCATOR = (By.CSS_SELECTOR, ElementsEnum.DISMISS_BUTTON.value)
+DISCARD_LOCATOR = (By.CSS_SELECTOR, ElementsEnum.DISCARD_BUTTON.value)
+SUBMIT_SELECTOR = ElementsEnum.SUBMIT_BUTTON.value
+_STEP_PROBE = {
+    "error": ElementsEnum.ERROR_ICON.value,
+    "submit": SUBMIT_SELECTOR,
+    "next": NEXT_STEP_LOCATOR[1],
+    "review": REVIEW_LOCATOR[1],
+}
+_NEXT_STEP_BUTTONS = (("next", NEXT_STEP_LOCATOR), ("review", REVIEW_LOCATOR))
+
+# Per-element fill handlers by tag, all called as handler(driver, wait, el, answer)
+_HANDLERS = {
+    "input": lambda driver, wait, el, answer: handle_input(driver, el, answer),
+    "select": lambda driver, wait, el, answer: handle_select(driver, el, answer),
+    "textarea": lambda driver, wait, el, answer: handle_textarea(driver, el, answer),
+    "fieldset": handle_fieldset,
+}
+
+
+def _handle_generic(driver, wait, el, answer) -> None:
+    handle_generic_editable(driver, el, answer)
+
 
 class JobApplicatorService:
-    def __init__(self, driver, db, wait_seconds: int = 10):
+    def __init__(self, driver, db, wait_seconds: int = 10, poll_frequency: float = 0.1):
         self.driver = driver
         self.db = db
-        self.wait = WebDriverWait(driver, wait_seconds)
+        self.wait = WebDriverWait(driver, wait_seconds, poll_frequency=poll_frequency)
 
     # -------------------------------------------------------------------------
     # Public API
     # -------------------------------------------------------------------------
     def run(self, job: Job, submit: bool) -> None:
+        max_steps = settings.MAX_STEPS_PER_APPLICATION
         try:
             step_count = 0
             while True:
                 step_count += 1
-                if step_count > settings.MAX_STEPS_PER_APPLICATION:
-                    raise JobApplyError(
-                        f"Exceeded {settings.MAX_STEPS_PER_APPLICATION} steps; aborting to avoid an infinite loop."
-                    )
+                if step_count > max_steps:
+                    raise JobApplyError(f"Exceeded {max_steps} steps; aborting to avoid an infinite loop.")
 
                 payload = self.parse_form_fields()
 
                 if payload:
                     items = self._prepare_items_with_embeddings(payload)
                     self._hydrate_answers_from_history(items)
-                    ai_answers = self._generate_ai_answers_for_unanswered(items)
-                    self._merge_ai_answers(items, ai_answers)
+                    # History may have answered everything; then the AI step has nothing to do
+                    if not all(i.answer for i in items):
+                        ai_answers = self._generate_ai_answers_for_unanswered(items)
+                        self._merge_ai_answers(items, ai_answers)
                     fields = self.fill_fields(payload, items)
                     self._persist_filled_fields(fields, job.id)
 
-                if self._has_error_icon():
+                # Error icon, submit, next and review buttons in one round-trip
+                state = present_flags(self.driver, _STEP_PROBE)
+
+                if state["error"]:
                     self._close_and_discard()
                     self.db.job.update_status(pk=job.id, status=JobStatusEnum.FILL_OUT_FORM)
                     logger.error(f"❌ Couldn't fill out the form. {job.url}")
                     return
 
-                if self._check_questions_have_been_finished():
+                if state["submit"]:
                     if not submit:
                         self.db.job.update_status(pk=job.id, status=JobStatusEnum.READY_FOR_APPLY)
                         logger.success("✅ Job is ready for apply.")
                         return
-
-                    if click_if_exists(self.driver, By.CSS_SELECTOR, ElementsEnum.SUBMIT_BUTTON):
+                    if js_click_if_present(self.driver, SUBMIT_SELECTOR):
                         self.db.job.update_status(pk=job.id, status=JobStatusEnum.APPLIED)
                         logger.success("✅ Job has been submitted.")
                         return
-                    else:
-                        logger.error("❌ Couldn't submit the form.")
+                    logger.error("❌ Couldn't submit the form.")
 
-                if self._next_step():
+                if self._next_step(state):
                     continue
         except Exception as e:
             logger.error(f"❌ {str(e)}")
@@ -88,75 +124,130 @@ class JobApplicatorService:
     # -------------------------------------------------------------------------
     # Navigation helpers
     # -------------------------------------------------------------------------
-    def _next_step(self) -> bool:
+    def _next_step(self, state: Dict[str, bool]) -> bool:
         """
-        Attempts to go to the next step (or review). Returns True if we clicked something.
+        Goes to the next step (or review) if the step probe saw its button. Returns True if we clicked something.
         """
-        for sel in [ElementsEnum.NEXT_STEP_BUTTON, ElementsEnum.REVIEW_BUTTON]:
-            if click_if_exists(self.driver, By.CSS_SELECTOR, sel):
+        for key, locator in _NEXT_STEP_BUTTONS:
+            if state[key] and click_if_exists(self.driver, *locator):
                 return True
         return False
 
-    def _check_questions_have_been_finished(self) -> bool:
-        return bool(self.driver.find_elements(By.CSS_SELECTOR, ElementsEnum.SUBMIT_BUTTON))
-
-    def _has_error_icon(self) -> bool:
-        return bool(self.driver.find_elements(By.CSS_SELECTOR, ElementsEnum.ERROR_ICON))
-
     def _close_and_discard(self) -> None:
-        click_if_exists(self.driver, By.CSS_SELECTOR, ElementsEnum.DISMISS_BUTTON)
-        click_if_exists(self.driver, By.CSS_SELECTOR, ElementsEnum.DISCARD_BUTTON)
+        click_if_exists(self.driver, *DISMISS_LOCATOR)
+        click_if_exists(self.driver, *DISCARD_LOCATOR)
 
     # -------------------------------------------------------------------------
     # Data/DB helpers
     # -------------------------------------------------------------------------
     def _persist_filled_fields(self, fields: List[FormItemSchema], job_id: int) -> None:
         """
-        Persists field label/value/type with *fresh* embeddings of the label.
+        Persists field label/value/type with embeddings of the label.
         """
+        # Fields carry the embeddings computed for their items; only embed the ones that lack them
+        missing = [field.label for field in fields if field.embeddings is None]
+        fallback = dict(zip(missing, self._embed_labels(missing))) if missing else {}
+        rows = []
         for field in fields:
-            embeddings = EmbeddingService.get_embedding(field.label)
-            saved_field = self.db.field.insert(
-                label=field.label,
-                value=field.answer,
-                type=field.type,
-                embeddings=embeddings,
+            vector = field.embeddings if field.embeddings is not None else fallback[field.label]
+            rows.append(
+                {
+                    "label": field.label,
+                    "value": field.answer,
+                    "type": field.type,
+                    "embeddings": vector if vector is not None else [],
+                }
             )
-            self.db.field_job.insert(field_id=saved_field.id, job_id=job_id)
+
+        # One commit for the whole step instead of one per row
+        with self.db.transaction():
+            saved = self.db.field.insert_many(rows=rows)
+            self.db.field_job.insert_many(job_id=job_id, field_ids=[f.id for f in saved])
 
     # -------------------------------------------------------------------------
     # Answer pipeline
     # -------------------------------------------------------------------------
     def _prepare_items_with_embeddings(self, payload: List[Dict[str, str]]) -> List[FormItemSchema]:
         """
-        Takes raw parsed payload -> FormItemSchema list, computes and attaches embeddings (float32 bytes).
+        Takes raw parsed payload -> FormItemSchema list, computes and attaches embeddings (float32 arrays).
         """
         items = [FormItemSchema.from_payload_entry(p) for p in payload]
-        for item in items:
-            emb = EmbeddingService.get_embedding(item.label)
-            item.embeddings = np.asarray(emb, dtype=np.float32).tobytes()
+        for item, vector in zip(items, self._embed_labels([item.label for item in items])):
+            item.embeddings = vector
         return items
 
+    def _embed_labels(self, labels: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        float32 embedding per label (None on failure), served from the persistent
+        embedding cache; only labels never embedded before go to the API, in one batch.
+        """
+        keys = [self._embedding_cache_key(label) for label in labels]
+        cached = self.db.embedding_cache.get_many(keys=list(set(keys)))
+
+        missing = list(dict.fromkeys(label for label, key in zip(labels, keys) if key not in cached))
+        if missing:
+            fresh = EmbeddingService.get_embeddings(missing)
+            with self.db.transaction():
+                for label, emb in zip(missing, fresh):
+                    if not emb:
+                        continue
+                    key = self._embedding_cache_key(label)
+                    cached[key] = np.asarray(emb, dtype=np.float32).tobytes()
+                    self.db.embedding_cache.save(key=key, vector=cached[key])
+
+        return [np.frombuffer(cached[key], dtype=np.float32) if key in cached else None for key in keys]
+
+    @staticmethod
+    def _embedding_cache_key(label: str) -> str:
+        return hashlib.sha256(label.encode()).hexdigest()
+
     def _hydrate_answers_from_history(self, items: List[FormItemSchema]) -> None:
         """
         Fills answers for items whose labels closely match previously stored fields,
         using cosine similarity on embeddings. Operates in-place.
         """
-        historical = self.db.field.get_all()
-        if not historical or not items:
+        # Skip the history scan when nothing is left to answer or nothing could be matched
+        if not any(not i.answer and i.embeddings is not None for i in items):
+            return
+
+        historical = self.db.field.get_all_embeddings()
+        if not historical:
             return
 
         EmbeddingService.fill_out_items(items, historical)
 
     def _generate_ai_answers_for_unanswered(self, items: List[FormItemSchema]) -> List[Dict[str, str]]:
         """
-        Calls AI service for only unanswered items. Returns AI-produced answers
-        as a list of dicts with keys: label, answer, embeddings (optional).
+        Answers unanswered items from the persistent AI answer cache and calls the AI
+        service only for labels it has never seen. Returns AI-produced answers
+        as a list of dicts with keys: label, answer.
         """
-        unanswered = [{"label": i.label, "answer": ""} for i in items if not i.answer]
-        if not unanswered:
+        keys = {i.label: self._ai_cache_key(i.label) for i in items if not i.answer}
+        if not keys:
             return []
-        return FormAnswerAgent.ask(unanswered)
+
+        cached = self.db.ai_answer.get_many(keys=list(set(keys.values())))
+        answers = [{"label": label, "answer": cached[key]} for label, key in keys.items() if key in cached]
+        missing = [{"label": label, "answer": ""} for label, key in keys.items() if key not in cached]
+        if not missing:
+            return answers
+
+        # pydantic-ai is only loaded once an answer actually has to be generated
+        from bot.agents import FormAnswerAgent
+
+        fresh = [a for a in FormAnswerAgent.ask(missing) if isinstance(a, dict)]
+        with self.db.transaction():
+            for a in fresh:
+                label = a.get("label")
+                if label in keys and a.get("answer") not in (None, ""):
+                    self.db.ai_answer.save(key=keys[label], label=label, answer=str(a["answer"]))
+
+        return answers + fresh
+
+    @staticmethod
+    def _ai_cache_key(label: str) -> str:
+        normalized = _WHITESPACE_RE.sub(" ", label.lower().strip())
+        return hashlib.sha256(normalized.encode()).hexdigest()
 
     def _merge_ai_answers(self, items: List[FormItemSchema], ai_answers: List[Dict[str, str]]) -> None:
         """
@@ -186,29 +277,15 @@ class JobApplicatorService:
             logger.error("❌ could not find modal element")
             return []
 
-        form = next(iter(modal.find_elements(By.TAG_NAME, ElementsEnum.FORM)), None)
-        if not form:
-            return []
+        # Locates the form inside the modal in the same browser call
+        snapshot = snapshot_form(self.driver, modal)
 
         fields = (
-            extract_fields(
-                form,
-                ElementsEnum.INPUT_NOT_RADIO,
-                include_fn=lambda el: el.is_displayed() and el.is_enabled() and not el.get_attribute("value"),
-            )
-            + extract_fields(
-                form,
-                ElementsEnum.SELECT,
-                include_fn=lambda el: (
-                    el.is_displayed()
-                    and el.is_enabled()
-                    and ((el.get_attribute("value") or "").strip() in ("", "Select an option"))
-                ),
-                include_options=True,
-            )
-            + extract_textareas(form)
-            + extract_checkbox_groups(form)
-            + extract_radio_groups(form)
+            extract_fields(snapshot, "input", include_fn=should_include_input)
+            + extract_fields(snapshot, "select", include_fn=should_include_select, include_options=True)
+            + extract_textareas(snapshot)
+            + extract_checkbox_groups(snapshot)
+            + extract_radio_groups(snapshot)
         )
 
         return fields
@@ -224,37 +301,50 @@ class JobApplicatorService:
         """
         Fill collection of form fields using (label -> answer) pairs.
 
+        Simple fields are filled in one bulk browser call; only the ones it could not
+        handle (fieldsets, autocomplete inputs, ...) go through the per-element handlers,
+        after being scrolled into view together.
+
         Returns a list of FormItemSchema rows describing what was attempted.
         """
         result: List[FormItemSchema] = []
+        answers = list(answers)
         answer_map = {str(a.label): a.answer for a in answers}
+        emb_map = {str(a.label): a.embeddings for a in answers}
 
+        fields = list(fields)
+        ops = []
         for item in fields:
-            field_id = item["id"]
+            answer = answer_map.get(item["label"])
+            ops.append({"id": item["id"], "value": None if answer in (None, "") else str(answer)})
+        outcomes = bulk_fill(self.driver, ops)
+
+        pending = []
+        for item, outcome in zip(fields, outcomes):
             label = item["label"]
+            answer = answer_map.get(label)
+
+            # Unanswered fields are only reported, so never wait for their elements
+            if outcome["done"] or answer in (None, ""):
+                result.append(
+                    FormItemSchema(
+                        label=label, answer=answer, type=outcome["type"] or "", embeddings=emb_map.get(label)
+                    )
+                )
+                continue
 
-            el = wait_present_by_id(self.wait, field_id)
+            el = wait_present_by_id(self.wait, item["id"])
 
-            inferred_type = infer_type(el)
-            answer = answer_map.get(label)
+            inferred_type = outcome["type"] or infer_type(el)
 
-            result.append(FormItemSchema(label=label, answer=answer, type=inferred_type))
+            result.append(FormItemSchema(label=label, answer=answer, type=inferred_type, embeddings=emb_map.get(label)))
 
-            # Skip if no provided answer, but still report in result
-            if answer in (None, ""):
-                continue
+            pending.append((el, outcome["tag"] or el.tag_name.lower(), answer))
+
+        # One scroll round-trip for every element the handlers are about to touch
+        scroll_all_into_view(self.driver, [el for el, _, _ in pending])
 
-            tag = el.tag_name.lower()
-
-            if tag == "input":
-                handle_input(self.driver, el, answer)
-            elif tag == "select":
-                handle_select(self.driver, el, answer)
-            elif tag == "textarea":
-                handle_textarea(self.driver, el, answer)
-            elif tag == "fieldset":
-                handle_fieldset(self.driver, self.wait, el, answer)
-            else:
-                handle_generic_editable(self.driver, el, answer)
+        for el, tag, answer in pending:
+            _HANDLERS.get(tag, _handle_generic)(self.driver, self.wait, el, answer)
 
         return result
@@ -23,6 +23,7 @@ class Settings:
     WORK_TYPE: str = os.getenv("WORK_TYPE", "remote")
     KEYWORDS: str = os.getenv("KEYWORDS", "laravel,python,go")
     COUNTRIES: str = os.getenv("COUNTRIES")
+    SEARCH_CONCURRENCY: int = int(os.getenv("SEARCH_CONCURRENCY", 1))
 
     DEEPINFRA_EMBEDDING_API_URL: str = os.getenv(
         "DEEPINFRA_EMBEDDING_API_URL", "https://api.deepinfra.com/v1/inference/google/embeddinggemma-300m"
@@ -34,8 +35,8 @@ class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
 
     # AI
-    AI_MAX_RETRIES: int = os.getenv("AI_MAX_RETRIES", 5)
-    AI_BACKOFF_BASE: float = os.getenv("AI_BACKOFF_BASE", 0.5)
+    AI_MAX_RETRIES: int = int(os.getenv("AI_MAX_RETRIES", 5))
+    AI_BACKOFF_BASE: float = float(os.getenv("AI_BACKOFF_BASE", 0.5))
 
 
 settings = Settings()